@@ -1,21 +1,38 @@
+import asyncio
+import hashlib
 import os
-from typing import Any, Dict, List
+import sqlite3
+from functools import wraps
+from itertools import groupby
+from typing import Any, Awaitable, Callable, Dict, List
 
+import httpx
+import numpy as np
 import pandas as pd
-import requests
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.decorator import cache
+from redis import asyncio as aioredis
 
 from backend import config
-from backend.common.db import get_connection
+from backend.common.db import OHLCV_DTYPES, get_db, init_database
 
 
-app = FastAPI(title="Crypto Analytics API Gateway", version="1.0.0")
+app = FastAPI(
+    title="Crypto Analytics API Gateway",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=config.ALLOWED_ORIGINS,
+    allow_credentials=config.ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -28,125 +45,233 @@ ONCHAIN_SERVICE_URL = os.getenv(
     "ONCHAIN_SERVICE_URL", "http://onchain-sentiment-service:8003"
 )
 
+# Response cache backend. Redis is used when REDIS_HOST is set, otherwise
+# every gateway worker keeps its own in-memory cache.
+REDIS_HOST = os.getenv("REDIS_HOST")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+
+# Only request parameters take part in cache keys (never injected objects).
+CACHE_KEY_PARAMS = ("coin_id", "coin1", "coin2", "days", "timeframe", "limit", "after")
+
+
+def _cache_key_builder(
+    func: Any,
+    namespace: str = "",
+    *,
+    request: Request | None = None,
+    response: Response | None = None,
+    args: tuple[Any, ...] = (),
+    kwargs: Dict[str, Any] | None = None,
+) -> str:
+    params = ":".join(
+        f"{name}={kwargs[name]}"
+        for name in CACHE_KEY_PARAMS
+        if kwargs and name in kwargs
+    )
+    # Endpoints guarded by `_with_etag` also key on the latest stored date,
+    # so a new daily candle never serves a stale cached payload.
+    etag = getattr(request.state, "etag", "") if request is not None else ""
+    return f"{FastAPICache.get_prefix()}:{namespace}:{func.__name__}:{params}:{etag}"
+
+
+@app.on_event("startup")
+def prepare_database() -> None:
+    init_database()
+
+
+@app.on_event("startup")
+async def init_cache() -> None:
+    if REDIS_HOST:
+        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        backend = RedisBackend(redis)
+    else:
+        backend = InMemoryBackend()
+    FastAPICache.init(backend, prefix="gw", key_builder=_cache_key_builder)
+
+
+@app.on_event("startup")
+async def open_http_client() -> None:
+    # One keep-alive client shared by all proxy endpoints, so upstream
+    # connections are reused instead of re-established on every call.
+    app.state.client = httpx.AsyncClient(http2=True, timeout=60)
+
+
+@app.on_event("shutdown")
+async def close_http_client() -> None:
+    await app.state.client.aclose()
+
 
 @app.get("/")
 def root() -> Dict[str, Any]:
     return {"message": "Crypto Analytics API Gateway", "docs": "/docs"}
 
 
-def _fetch_rows(query: str, params: tuple[Any, ...]) -> List[Any]:
-    conn = get_connection()
+def _week_stats(week_data: List[Any]) -> tuple[float, float, float, float, float]:
+    """
+    Summary statistics over `(high, low, close, volume)` rows of the last week.
+
+    Returns `(week_high, week_low, volatility, avg_volume, vwap)`. Missing
+    and zero values are ignored, matching the Homework 3 list-based logic.
+    """
+    if not week_data:
+        return 0, 0, 0, 0, 0
+
+    arr = np.nan_to_num(np.array(week_data, dtype=np.float64))
+    highs, lows, closes, volumes = arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
+
+    valid_highs = highs[highs != 0]
+    valid_lows = lows[lows > 0]
+    valid_closes = closes[closes != 0]
+    valid_volumes = volumes[volumes != 0]
+
+    week_high = float(valid_highs.max()) if valid_highs.size else 0
+    week_low = float(valid_lows.min()) if valid_lows.size else 0
+    volatility = float(valid_closes.std()) if valid_closes.size > 1 else 0
+    avg_volume = float(valid_volumes.mean()) if valid_volumes.size else 0
+
+    # Rows with a missing close or volume contribute zero to both sums.
+    total_volume = volumes.sum()
+    vwap = float((closes * volumes).sum() / total_volume) if total_volume > 0 else 0
+
+    return week_high, week_low, volatility, avg_volume, vwap
+
+
+def _etag_for(conn: sqlite3.Connection, symbols: tuple[str, ...], days: int) -> str:
+    """
+    ETag for an OHLCV history response.
+
+    Past rows are immutable, so the payload only changes when a new latest
+    date is stored for one of the symbols; one `MAX(date)` query is enough
+    to revalidate it.
+    """
+    placeholders = ", ".join("?" for _ in symbols)
     cursor = conn.cursor()
-    cursor.execute(query, params)
+    cursor.execute(
+        f"""
+        SELECT symbol, MAX(date) FROM {config.TABLE_NAME}
+        WHERE symbol IN ({placeholders}) GROUP BY symbol
+    """,
+        symbols,
+    )
     rows = cursor.fetchall()
-    conn.close()
-    return rows
+    latest = {row[0]: row[1] for row in rows}
+    tips = ",".join(f"{symbol}@{latest.get(symbol)}" for symbol in symbols)
+    digest = hashlib.md5(f"{tips}:{days}".encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _with_etag(
+    symbols_of: Callable[[Dict[str, Any]], tuple[str, ...]],
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Answer `If-None-Match` revalidations with `304 Not Modified`.
+
+    Must wrap a `@cache`-decorated endpoint that takes `conn` from `get_db`;
+    `@cache` injects its `request` and `response` arguments. The ETag is set
+    after the cache layer runs so it replaces the cache's own per-process hash.
+    """
+
+    def decorator(endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request: Request = kwargs["request"]
+            response: Response = kwargs["response"]
+
+            etag = await run_in_threadpool(
+                _etag_for, kwargs["conn"], symbols_of(kwargs), kwargs["days"]
+            )
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+
+            request.state.etag = etag
+            result = await endpoint(*args, **kwargs)
+            response.headers["ETag"] = etag
+            return result
+
+        return wrapper
+
+    return decorator
 
 
 @app.get("/coins")
-def get_coins(limit: int = 100) -> List[Dict[str, Any]]:
+@cache(expire=60)
+def get_coins(
+    limit: int = 100, after: str = "", conn: sqlite3.Connection = Depends(get_db)
+) -> Dict[str, Any]:
     """
-    List of coins with latest price and basic metrics.
+    Page of coins with latest price and basic metrics.
 
-    Logic copied from Homework 3 `get_coins`, so the frontend can stay the same.
+    Per-coin logic copied from Homework 3 `get_coins`. Pages are keyset
+    paginated by symbol: pass the previous page's `nextCursor` as `after`
+    to continue; `nextCursor` is `None` on the last page.
+
+    Everything is fetched in one windowed query: the last 7 rows of each
+    selected symbol are tagged via `ROW_NUMBER`, with the previous close
+    (`LAG`) and ATH/ATL (`MAX`/`MIN`) attached as window columns.
     """
     try:
-        conn = get_connection()
         cursor = conn.cursor()
 
         cursor.execute(
             f"""
-            SELECT DISTINCT symbol FROM {config.TABLE_NAME}
-            ORDER BY symbol ASC LIMIT ?
+            WITH selected AS (
+                SELECT DISTINCT symbol FROM {config.TABLE_NAME}
+                WHERE symbol > ?
+                ORDER BY symbol ASC LIMIT ?
+            ),
+            ranked AS (
+                SELECT t.symbol, t.date, t.high, t.low, t.close, t.volume,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY t.symbol ORDER BY t.date DESC
+                       ) AS rn,
+                       LAG(t.close) OVER (
+                           PARTITION BY t.symbol ORDER BY t.date
+                       ) AS prev_close,
+                       MAX(t.close) OVER (PARTITION BY t.symbol) AS ath,
+                       MIN(t.close) OVER (PARTITION BY t.symbol) AS atl
+                FROM {config.TABLE_NAME} t
+                JOIN selected s ON s.symbol = t.symbol
+            )
+            SELECT symbol, date, high, low, close, volume, prev_close, ath, atl
+            FROM ranked
+            WHERE rn <= 7
+            ORDER BY symbol ASC, rn ASC
         """,
-            (limit,),
+            (after, limit),
         )
-        symbols = [row[0] for row in cursor.fetchall()]
+        rows = cursor.fetchall()
 
         coins: List[Dict[str, Any]] = []
-        for symbol in symbols:
-            cursor.execute(
-                f"""
-                SELECT close, date, volume FROM {config.TABLE_NAME}
-                WHERE symbol = ? ORDER BY date DESC LIMIT 1
-            """,
-                (symbol,),
-            )
-            latest = cursor.fetchone()
-            if not latest:
-                continue
+        for symbol, group in groupby(rows, key=lambda r: r[0]):
+            # Rows come newest first, so the first one is the latest bar
+            # and carries the per-symbol window columns.
+            symbol_rows = list(group)
+            latest = symbol_rows[0]
 
-            current_price = float(latest[0]) if latest[0] else 0
+            current_price = float(latest[4]) if latest[4] else 0
             latest_date = latest[1]
-            latest_volume = float(latest[2]) if latest[2] else 0
-
-            cursor.execute(
-                f"""
-                SELECT close FROM {config.TABLE_NAME}
-                WHERE symbol = ? AND date < ?
-                ORDER BY date DESC LIMIT 1
-            """,
-                (symbol, latest_date),
-            )
-            prev_row = cursor.fetchone()
-            prev_price = float(prev_row[0]) if prev_row and prev_row[0] else current_price
+            latest_volume = float(latest[5]) if latest[5] else 0
+
+            prev_price = float(latest[6]) if latest[6] else current_price
 
             price_change_24h = (
                 (current_price - prev_price) / prev_price * 100 if prev_price > 0 else 0
             )
 
-            cursor.execute(
-                f"""
-                SELECT high, low, close, volume FROM {config.TABLE_NAME}
-                WHERE symbol = ? ORDER BY date DESC LIMIT 7
-            """,
-                (symbol,),
-            )
-            week_data = cursor.fetchall()
-
-            week_high = max([float(r[0]) for r in week_data if r[0]], default=0)
-            week_low = min(
-                [float(r[1]) for r in week_data if r[1] and r[1] > 0], default=0
+            week_high, week_low, volatility, avg_volume, _ = _week_stats(
+                [r[2:6] for r in symbol_rows]
             )
-            week_closes = [float(r[2]) for r in week_data if r[2]]
-            week_volumes = [float(r[3]) for r in week_data if r[3]]
 
-            avg_volume = sum(week_volumes) / len(week_volumes) if week_volumes else 0
-
-            if len(week_closes) > 1:
-                mean_price = sum(week_closes) / len(week_closes)
-                variance = sum((p - mean_price) ** 2 for p in week_closes) / len(
-                    week_closes
-                )
-                volatility = variance ** 0.5
-            else:
-                volatility = 0
-
-            cursor.execute(
-                f"""
-                SELECT MAX(close), MIN(close) FROM {config.TABLE_NAME}
-                WHERE symbol = ?
-            """,
-                (symbol,),
-            )
-            ath_atl = cursor.fetchone()
-            ath = float(ath_atl[0]) if ath_atl and ath_atl[0] else 0
-            atl = float(ath_atl[1]) if ath_atl and ath_atl[1] else 0
+            ath = float(latest[7]) if latest[7] else 0
+            atl = float(latest[8]) if latest[8] else 0
 
             # Simplified market cap approximation as in HW3
             market_cap = current_price * 1_000_000
             liquidity_score = (avg_volume / market_cap * 100) if market_cap > 0 else 0
 
-            cursor.execute(
-                f"""
-                SELECT date, close FROM {config.TABLE_NAME}
-                WHERE symbol = ? ORDER BY date DESC LIMIT 7
-            """,
-                (symbol,),
-            )
             sparkline_data = [
-                {"date": r[0], "price": float(r[1]) if r[1] else 0}
-                for r in cursor.fetchall()
+                {"date": r[1], "price": float(r[4]) if r[4] else 0}
+                for r in symbol_rows
             ]
 
             coins.append(
@@ -166,14 +291,17 @@ def get_coins(limit: int = 100) -> List[Dict[str, Any]]:
                 }
             )
 
-        conn.close()
-        return coins
+        next_cursor = coins[-1]["symbol"] if coins and len(coins) == limit else None
+        return {"items": coins, "nextCursor": next_cursor}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
 @app.get("/coins/{coin_id}")
-def get_coin_details(coin_id: str) -> Dict[str, Any]:
+@cache(expire=30)
+def get_coin_details(
+    coin_id: str, conn: sqlite3.Connection = Depends(get_db)
+) -> Dict[str, Any]:
     """
     Detailed metrics for a single coin.
 
@@ -181,35 +309,32 @@ def get_coin_details(coin_id: str) -> Dict[str, Any]:
     """
     try:
         coin_id = coin_id.upper()
-        conn = get_connection()
         cursor = conn.cursor()
 
+        # Latest row and the previous close in one round-trip; the window
+        # only spans the two newest rows, not the symbol's whole history.
         cursor.execute(
             f"""
-            SELECT symbol, close, date, volume FROM {config.TABLE_NAME}
-            WHERE symbol = ? ORDER BY date DESC LIMIT 1
+            SELECT symbol, close, date, volume, prev_close FROM (
+                SELECT symbol, close, date, volume,
+                       LAG(close) OVER (ORDER BY date) AS prev_close
+                FROM (
+                    SELECT symbol, close, date, volume FROM {config.TABLE_NAME}
+                    WHERE symbol = ? ORDER BY date DESC LIMIT 2
+                )
+            )
+            ORDER BY date DESC LIMIT 1
         """,
             (coin_id,),
         )
         latest = cursor.fetchone()
         if not latest:
-            conn.close()
             raise HTTPException(status_code=404, detail="Coin not found")
 
         current_price = float(latest[1]) if latest[1] else 0
         latest_date = latest[2]
         latest_volume = float(latest[3]) if latest[3] else 0
-
-        cursor.execute(
-            f"""
-            SELECT close FROM {config.TABLE_NAME}
-            WHERE symbol = ? AND date < ?
-            ORDER BY date DESC LIMIT 1
-        """,
-            (coin_id, latest_date),
-        )
-        prev_row = cursor.fetchone()
-        prev_price = float(prev_row[0]) if prev_row and prev_row[0] else current_price
+        prev_price = float(latest[4]) if latest[4] else current_price
         price_change_24h = (
             (current_price - prev_price) / prev_price * 100 if prev_price > 0 else 0
         )
@@ -231,36 +356,13 @@ def get_coin_details(coin_id: str) -> Dict[str, Any]:
         """,
             (coin_id,),
         )
-        week_data = cursor.fetchall()
-
-        week_high = max([float(r[0]) for r in week_data if r[0]], default=0)
-        week_low = min(
-            [float(r[1]) for r in week_data if r[1] and r[1] > 0], default=0
+        week_high, week_low, volatility, avg_volume, vwap = _week_stats(
+            cursor.fetchall()
         )
-        week_closes = [float(r[2]) for r in week_data if r[2]]
-        week_volumes = [float(r[3]) for r in week_data if r[3]]
-
-        if len(week_closes) > 1:
-            mean_price = sum(week_closes) / len(week_closes)
-            variance = sum((p - mean_price) ** 2 for p in week_closes) / len(
-                week_closes
-            )
-            volatility = variance ** 0.5
-        else:
-            volatility = 0
-
-        total_volume = sum(week_volumes) if week_volumes else 0
-        total_prices = sum(
-            [float(r[2]) * float(r[3]) for r in week_data if r[2] and r[3]]
-        )
-        vwap = (total_prices / total_volume) if total_volume > 0 else 0
 
         market_cap = current_price * 1_000_000
-        avg_volume = sum(week_volumes) / len(week_volumes) if week_volumes else 0
         liquidity_score = (avg_volume / market_cap * 100) if market_cap > 0 else 0
 
-        conn.close()
-
         return {
             "symbol": latest[0],
             "currentPrice": current_price,
@@ -284,37 +386,40 @@ def get_coin_details(coin_id: str) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+def _read_history(conn: sqlite3.Connection, symbol: str, days: int) -> List[Dict[str, Any]]:
+    """
+    Last `days` OHLCV rows of `symbol` in ascending date order, as records.
+
+    Rows are converted by pandas in bulk; missing values become 0.
+    """
+    df = pd.read_sql(
+        f"""
+        SELECT date, open, high, low, close, volume
+        FROM {config.TABLE_NAME}
+        WHERE symbol = ? ORDER BY date DESC LIMIT ?
+    """,
+        conn,
+        params=(symbol, days),
+        dtype=OHLCV_DTYPES,
+    )
+    return df.iloc[::-1].fillna(0).to_dict("records")
+
+
 @app.get("/coins/{coin_id}/history")
-def get_coin_history(coin_id: str, days: int = 365) -> Dict[str, Any]:
+@_with_etag(lambda params: (params["coin_id"].upper(),))
+@cache(expire=86400)
+def get_coin_history(
+    coin_id: str, days: int = 365, conn: sqlite3.Connection = Depends(get_db)
+) -> Dict[str, Any]:
     """
     OHLCV history for `coin_id` over the last `days` rows.
     """
     try:
         coin_id = coin_id.upper()
-        rows = _fetch_rows(
-            f"""
-            SELECT date, open, high, low, close, volume
-            FROM {config.TABLE_NAME}
-            WHERE symbol = ? ORDER BY date DESC LIMIT ?
-        """,
-            (coin_id, days),
-        )
-        if not rows:
+        history = _read_history(conn, coin_id, days)
+        if not history:
             raise HTTPException(status_code=404, detail="No data found")
 
-        history: List[Dict[str, Any]] = []
-        for row in reversed(rows):
-            history.append(
-                {
-                    "date": row[0],
-                    "open": float(row[1]) if row[1] else 0,
-                    "high": float(row[2]) if row[2] else 0,
-                    "low": float(row[3]) if row[3] else 0,
-                    "close": float(row[4]) if row[4] else 0,
-                    "volume": float(row[5]) if row[5] else 0,
-                }
-            )
-
         return {"symbol": coin_id, "data": history}
     except HTTPException:
         raise
@@ -323,7 +428,14 @@ def get_coin_history(coin_id: str, days: int = 365) -> Dict[str, Any]:
 
 
 @app.get("/compare")
-def compare_coins(coin1: str, coin2: str, days: int = 365) -> Dict[str, Any]:
+@_with_etag(lambda params: (params["coin1"].upper(), params["coin2"].upper()))
+@cache(expire=300)
+def compare_coins(
+    coin1: str,
+    coin2: str,
+    days: int = 365,
+    conn: sqlite3.Connection = Depends(get_db),
+) -> Dict[str, Any]:
     """
     Compare two coins side-by-side, returning their OHLCV history.
     """
@@ -332,45 +444,17 @@ def compare_coins(coin1: str, coin2: str, days: int = 365) -> Dict[str, Any]:
         if coin1 == coin2:
             raise HTTPException(status_code=400, detail="Coins must be different")
 
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        def get_history(symbol: str) -> List[Any]:
-            cursor.execute(
-                f"""
-                SELECT date, open, high, low, close, volume
-                FROM {config.TABLE_NAME}
-                WHERE symbol = ? ORDER BY date DESC LIMIT ?
-            """,
-                (symbol, days),
-            )
-            return cursor.fetchall()
-
-        rows1 = get_history(coin1)
-        rows2 = get_history(coin2)
-        conn.close()
+        history1 = _read_history(conn, coin1, days)
+        history2 = _read_history(conn, coin2, days)
 
-        if not rows1:
+        if not history1:
             raise HTTPException(status_code=404, detail=f"{coin1} not found")
-        if not rows2:
+        if not history2:
             raise HTTPException(status_code=404, detail=f"{coin2} not found")
 
-        def format_data(rows: List[Any]) -> List[Dict[str, Any]]:
-            return [
-                {
-                    "date": r[0],
-                    "open": float(r[1]) if r[1] else 0,
-                    "high": float(r[2]) if r[2] else 0,
-                    "low": float(r[3]) if r[3] else 0,
-                    "close": float(r[4]) if r[4] else 0,
-                    "volume": float(r[5]) if r[5] else 0,
-                }
-                for r in reversed(rows)
-            ]
-
         return {
-            "coin1": {"symbol": coin1, "data": format_data(rows1)},
-            "coin2": {"symbol": coin2, "data": format_data(rows2)},
+            "coin1": {"symbol": coin1, "data": history1},
+            "coin2": {"symbol": coin2, "data": history2},
         }
     except HTTPException:
         raise
@@ -379,13 +463,13 @@ def compare_coins(coin1: str, coin2: str, days: int = 365) -> Dict[str, Any]:
 
 
 @app.get("/coins/{coin_id}/technical")
-def get_technical_analysis(coin_id: str, timeframe: str = "1m") -> Dict[str, Any]:
+async def get_technical_analysis(coin_id: str, timeframe: str = "1m") -> Dict[str, Any]:
     """
     Proxy to the technical analysis microservice.
     """
     coin_id = coin_id.upper()
     try:
-        resp = requests.get(
+        resp = await app.state.client.get(
             f"{TECH_SERVICE_URL}/technical/{coin_id}",
             params={"timeframe": timeframe},
             timeout=30,
@@ -400,7 +484,7 @@ def get_technical_analysis(coin_id: str, timeframe: str = "1m") -> Dict[str, Any
 
 
 @app.get("/coins/{coin_id}/predict")
-def get_price_prediction(
+async def get_price_prediction(
     coin_id: str, lookback: int = 30, epochs: int = 15
 ) -> Dict[str, Any]:
     """
@@ -408,7 +492,7 @@ def get_price_prediction(
     """
     coin_id = coin_id.upper()
     try:
-        resp = requests.get(
+        resp = await app.state.client.get(
             f"{LSTM_SERVICE_URL}/predict/{coin_id}",
             params={"lookback": lookback, "epochs": epochs, "use_cache": True},
             timeout=60,
@@ -422,14 +506,35 @@ def get_price_prediction(
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@app.get("/coins/{coin_id}/predict/status")
+async def get_prediction_status(coin_id: str, lookback: int = 30) -> Dict[str, Any]:
+    """
+    Proxy to the LSTM service's training job status, for clients polling a
+    `{"status": "training"}` prediction response.
+    """
+    coin_id = coin_id.upper()
+    try:
+        resp = await app.state.client.get(
+            f"{LSTM_SERVICE_URL}/predict/{coin_id}/status",
+            params={"lookback": lookback},
+        )
+        if resp.status_code != 200:
+            raise HTTPException(status_code=resp.status_code, detail=resp.text)
+        return resp.json()
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
 @app.get("/coins/{coin_id}/onchain-sentiment")
-def get_onchain_sentiment(coin_id: str) -> Dict[str, Any]:
+async def get_onchain_sentiment(coin_id: str) -> Dict[str, Any]:
     """
     Proxy to the on-chain & sentiment microservice.
     """
     coin_id = coin_id.upper()
     try:
-        resp = requests.get(
+        resp = await app.state.client.get(
             f"{ONCHAIN_SERVICE_URL}/onchain-sentiment/{coin_id}",
             timeout=60,
         )
@@ -442,3 +547,54 @@ def get_onchain_sentiment(coin_id: str) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+def _dashboard_part(result: httpx.Response | BaseException) -> Dict[str, Any]:
+    """Turn one upstream outcome into a dashboard field or an error payload."""
+    if isinstance(result, BaseException):
+        return {"error": "service_unavailable", "message": str(result)}
+    if result.status_code != 200:
+        return {
+            "error": "service_error",
+            "status": result.status_code,
+            "message": result.text,
+        }
+    return result.json()
+
+
+@app.get("/coins/{coin_id}/dashboard")
+async def get_coin_dashboard(
+    coin_id: str, timeframe: str = "1m", lookback: int = 30, epochs: int = 15
+) -> Dict[str, Any]:
+    """
+    Technical analysis, prediction and on-chain sentiment in one call.
+
+    The three microservices are queried concurrently, so latency is that of
+    the slowest one rather than the sum. A failing service only turns its
+    own field into an error payload.
+    """
+    coin_id = coin_id.upper()
+    client: httpx.AsyncClient = app.state.client
+
+    technical, prediction, onchain = await asyncio.gather(
+        client.get(
+            f"{TECH_SERVICE_URL}/technical/{coin_id}",
+            params={"timeframe": timeframe},
+            timeout=30,
+        ),
+        client.get(
+            f"{LSTM_SERVICE_URL}/predict/{coin_id}",
+            params={"lookback": lookback, "epochs": epochs, "use_cache": True},
+            timeout=60,
+        ),
+        client.get(
+            f"{ONCHAIN_SERVICE_URL}/onchain-sentiment/{coin_id}",
+            timeout=60,
+        ),
+        return_exceptions=True,
+    )
+
+    return {
+        "symbol": coin_id,
+        "technical": _dashboard_part(technical),
+        "prediction": _dashboard_part(prediction),
+        "onchainSentiment": _dashboard_part(onchain),
+    }
@@ -14,9 +14,10 @@ individual strategy implementations.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict
 
+import numpy as np
 import pandas as pd
 
 from .strategies.base import AnalyticsStrategy
@@ -24,6 +25,15 @@ from .strategies.lstm import LSTMPredictionStrategy
 from .strategies.onchain import OnchainSentimentStrategy
 from .strategies.technical import TechnicalAnalysisStrategy
 
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+# Strategies hold no per-request state, so all facades share one instance
+# of each, built once at import time.
+_TECHNICAL_STRATEGY = TechnicalAnalysisStrategy()
+_LSTM_STRATEGY = LSTMPredictionStrategy()
+_ONCHAIN_STRATEGY = OnchainSentimentStrategy()
+
 
 @dataclass
 class AnalyticsFacade:
@@ -35,30 +45,23 @@ class AnalyticsFacade:
     layer and microservices to call.
     """
 
-    technical_strategy: AnalyticsStrategy | None = None
-    lstm_strategy: AnalyticsStrategy | None = None
-    onchain_strategy: AnalyticsStrategy | None = None
-
-    def __post_init__(self) -> None:
-        # Lazy defaults so the facade can also be constructed with custom strategies
-        if self.technical_strategy is None:
-            self.technical_strategy = TechnicalAnalysisStrategy()
-        if self.lstm_strategy is None:
-            self.lstm_strategy = LSTMPredictionStrategy()
-        if self.onchain_strategy is None:
-            self.onchain_strategy = OnchainSentimentStrategy()
+    # Shared defaults; the facade can still be constructed with custom strategies
+    technical_strategy: AnalyticsStrategy = field(default_factory=lambda: _TECHNICAL_STRATEGY)
+    lstm_strategy: AnalyticsStrategy = field(default_factory=lambda: _LSTM_STRATEGY)
+    onchain_strategy: AnalyticsStrategy = field(default_factory=lambda: _ONCHAIN_STRATEGY)
 
     @staticmethod
     def _prepare_df(df: pd.DataFrame) -> pd.DataFrame:
         """
         Normalize incoming OHLCV data frame:
-        - Ensure we operate on a copy
-        - Sort by date ascending
+        - Sort by date ascending (a new frame is only built when the
+          input is not already in order)
+
+        Strategies must not mutate the returned frame in place.
         """
-        prepared = df.copy()
-        if "date" in prepared.columns:
-            prepared = prepared.sort_values("date")
-        return prepared
+        if "date" not in df.columns or df["date"].is_monotonic_increasing:
+            return df
+        return df.sort_values("date", ignore_index=True)
 
     # Public, high-level methods used by services/API
 
@@ -82,6 +85,31 @@ class AnalyticsFacade:
             "indicators": result.get("indicators", result),
         }
 
+    def get_technical_from_arrays(
+        self,
+        symbol: str,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        timeframe: str = "1m",
+    ) -> Dict[str, Any]:
+        """
+        Same as `get_technical`, for float64 column arrays that are already
+        sorted by date ascending.
+        """
+        result = self.technical_strategy.analyze_arrays(
+            symbol, high=high, low=low, close=close, volume=volume
+        )
+        if "error" in result:
+            return result
+
+        return {
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "indicators": result.get("indicators", result),
+        }
+
     def get_prediction(
         self,
         symbol: str,
@@ -89,12 +117,14 @@ class AnalyticsFacade:
         lookback: int = 30,
         epochs: int = 15,
         use_cache: bool = True,
+        allow_training: bool = True,
     ) -> Dict[str, Any]:
         """
         Generate an LSTM-based next-close prediction for the given symbol.
 
         Delegates details (training vs cached model, metrics calculation)
-        to the LSTM strategy.
+        to the LSTM strategy. With `allow_training=False` only a cached
+        model is used, and a `model_not_cached` error is returned without one.
         """
         prepared_df = self._prepare_df(df)
         return self.lstm_strategy.analyze(
@@ -103,6 +133,7 @@ class AnalyticsFacade:
             lookback=lookback,
             epochs=epochs,
             use_cache=use_cache,
+            allow_training=allow_training,
         )
 
     def get_onchain_sentiment(self, symbol: str, df: pd.DataFrame) -> Dict[str, Any]:
@@ -113,4 +144,26 @@ class AnalyticsFacade:
         prepared_df = self._prepare_df(df)
         return self.onchain_strategy.analyze(prepared_df, symbol)
 
+    def get_onchain_sentiment_from_arrays(
+        self, symbol: str, close: np.ndarray, volume: np.ndarray
+    ) -> Dict[str, Any]:
+        """
+        Same as `get_onchain_sentiment`, for close and volume arrays that
+        are already sorted by date ascending.
+        """
+        return self.onchain_strategy.analyze_arrays(symbol, close=close, volume=volume)
 
+    async def get_onchain_sentiment_async(
+        self,
+        symbol: str,
+        close: np.ndarray,
+        volume: np.ndarray,
+        client: httpx.AsyncClient,
+    ) -> Dict[str, Any]:
+        """
+        Same as `get_onchain_sentiment_from_arrays`, without blocking the
+        event loop. News and Reddit are fetched with `client`.
+        """
+        return await self.onchain_strategy.analyze_arrays_async(
+            symbol, client, close=close, volume=volume
+        )
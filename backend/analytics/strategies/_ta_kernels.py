@@ -0,0 +1,194 @@
+"""
+Numba kernels for the technical analysis strategy.
+
+`compute_all_last` evaluates every indicator used by
+`technical._calculate_technical_indicators_from_arrays` in one pass over
+the OHLCV arrays and returns only the values of the last bar. It reproduces
+the `ta` library definitions (including pandas' `ewm(adjust=False)`
+recursion), so both code paths produce the same output.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+# Names of the values returned by `compute_all_last`, in order.
+LAST_KEYS = (
+    "sma_20",
+    "ema_20",
+    "wma_20",
+    "hma_20",
+    "vwap",
+    "rsi_14",
+    "macd",
+    "macd_signal",
+    "macd_hist",
+    "stoch_k",
+    "stoch_d",
+    "cci_20",
+    "mfi_14",
+)
+
+
+@njit(cache=True, error_model="numpy")
+def _ewm_step(prev: float, value: float, alpha: float) -> float:
+    # Same update as pandas' `ewm(adjust=False).mean()`.
+    if prev == value:
+        return prev
+    old_wt = 1.0 - alpha
+    return (old_wt * prev + alpha * value) / (old_wt + alpha)
+
+
+@njit(cache=True, error_model="numpy")
+def _wma_at(values: np.ndarray, end: int, window: int) -> float:
+    # `ta` WMA ending at index `end` (inclusive): weights i * 2 / (n(n + 1)).
+    total = 0.0
+    denom = window * (window + 1)
+    for i in range(window):
+        total += (i + 1) * 2 / denom * values[end - window + 1 + i]
+    return total
+
+
+@njit(cache=True, error_model="numpy")
+def compute_all_last(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray
+) -> tuple:
+    """
+    Last-bar indicator values for finite OHLCV arrays of at least 50 rows,
+    in the order of `LAST_KEYS`.
+    """
+    n = close.shape[0]
+    last = n - 1
+
+    # Full-length recursions: EMA(20), MACD(12, 26, 9), Wilder RSI(14) and
+    # the cumulative sums for VWAP / the previous typical price for MFI.
+    a20 = 2.0 / 21.0
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+    a14 = 1.0 / 14.0
+
+    ema20 = close[0]
+    ema12 = close[0]
+    ema26 = close[0]
+    signal = 0.0
+    up = 0.0
+    down = 0.0
+    cum_vol = 0.0
+    cum_tp_vol = 0.0
+    typical = np.empty(n)
+    flow = np.empty(n)
+
+    for i in range(n):
+        c = close[i]
+        tp = (high[i] + low[i] + c) / 3.0
+        typical[i] = tp
+        cum_vol += volume[i]
+        cum_tp_vol += tp * volume[i]
+
+        if i == 0:
+            flow[i] = 0.0
+            continue
+
+        ema20 = _ewm_step(ema20, c, a20)
+        ema12 = _ewm_step(ema12, c, a12)
+        ema26 = _ewm_step(ema26, c, a26)
+
+        # The MACD line only exists once the slow EMA has 26 observations;
+        # the signal EMA starts from its first value.
+        if i == 25:
+            signal = ema12 - ema26
+        elif i > 25:
+            signal = _ewm_step(signal, ema12 - ema26, a9)
+
+        diff = c - close[i - 1]
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        if i == 1:
+            # The first diff is NaN in pandas and counts as a zero move.
+            up = _ewm_step(0.0, gain, a14)
+            down = _ewm_step(0.0, loss, a14)
+        else:
+            up = _ewm_step(up, gain, a14)
+            down = _ewm_step(down, loss, a14)
+
+        if tp > typical[i - 1]:
+            flow[i] = tp * volume[i]
+        elif tp < typical[i - 1]:
+            flow[i] = -tp * volume[i]
+        else:
+            flow[i] = 0.0
+
+    # Moving averages
+    sma20 = 0.0
+    weighted = 0.0
+    for i in range(20):
+        value = close[last - 19 + i]
+        sma20 += value
+        weighted += (i + 1) * value
+    sma20 /= 20.0
+    wma20 = weighted / 210.0
+
+    # Hull MA: WMA(4) over 2 * WMA(10) - WMA(20)
+    raw_hma = np.empty(4)
+    for j in range(4):
+        end = last - 3 + j
+        raw_hma[j] = 2 * _wma_at(close, end, 10) - _wma_at(close, end, 20)
+    hma20 = _wma_at(raw_hma, 3, 4)
+
+    vwap = cum_tp_vol / cum_vol
+
+    # Oscillators
+    rsi = 100.0 if down == 0 else 100 - (100 / (1 + up / down))
+    macd = ema12 - ema26
+    macd_hist = macd - signal
+
+    stoch = np.empty(3)
+    for j in range(3):
+        end = last - 2 + j
+        lowest = low[end]
+        highest = high[end]
+        for k in range(end - 13, end):
+            if low[k] < lowest:
+                lowest = low[k]
+            if high[k] > highest:
+                highest = high[k]
+        stoch[j] = 100 * (close[end] - lowest) / (highest - lowest)
+    stoch_k = stoch[2]
+    stoch_d = (stoch[0] + stoch[1] + stoch[2]) / 3.0
+
+    tp_mean = 0.0
+    for i in range(last - 19, n):
+        tp_mean += typical[i]
+    tp_mean /= 20.0
+    mad = 0.0
+    for i in range(last - 19, n):
+        mad += abs(typical[i] - tp_mean)
+    mad /= 20.0
+    cci = (typical[last] - tp_mean) / (0.015 * mad)
+
+    positive = 0.0
+    negative = 0.0
+    for i in range(last - 13, n):
+        if flow[i] >= 0.0:
+            positive += flow[i]
+        else:
+            negative += flow[i]
+    mfi = 100 - (100 / (1 + positive / abs(negative)))
+
+    return (
+        sma20,
+        ema20,
+        wma20,
+        hma20,
+        vwap,
+        rsi,
+        macd,
+        signal,
+        macd_hist,
+        stoch_k,
+        stoch_d,
+        cci,
+        mfi,
+    )
@@ -8,9 +8,11 @@ sentiment) while keeping each algorithm in its own class.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
+import numpy as np
 import pandas as pd
 
 
@@ -34,4 +36,25 @@ class AnalyticsStrategy(ABC):
         """
         raise NotImplementedError
 
+    def analyze_arrays(self, symbol: str, **columns: np.ndarray) -> Dict[str, Any]:
+        """
+        Same as `analyze`, for date-sorted float64 column arrays passed by
+        column name (e.g. `close=..., volume=...`).
+
+        The default builds a DataFrame and calls `analyze`; strategies that
+        only need a few columns override it to skip the DataFrame.
+        """
+        return self.analyze(pd.DataFrame(columns), symbol)
+
+    async def analyze_arrays_async(
+        self, symbol: str, client: Any, **columns: np.ndarray
+    ) -> Dict[str, Any]:
+        """
+        Same as `analyze_arrays`, for use from an event loop. `client` is a
+        shared `httpx.AsyncClient` for strategies that fetch remote data.
+
+        The default runs `analyze_arrays` in a worker thread.
+        """
+        return await asyncio.to_thread(self.analyze_arrays, symbol, **columns)
+
 
@@ -7,18 +7,20 @@ This wraps the Homework 3 LSTM training/prediction logic behind the
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.metrics import mean_absolute_percentage_error, mean_squared_error, r2_score
 from sklearn.preprocessing import MinMaxScaler
 
 from .base import AnalyticsStrategy
 
 try:
+    import tensorflow as tf
     from tensorflow import keras  # noqa: F401
-    from tensorflow.keras.models import Sequential, load_model
+    from tensorflow.keras.models import Sequential, model_from_json
     from tensorflow.keras.layers import LSTM, Dense, Dropout
 
     TENSORFLOW_AVAILABLE = True
@@ -26,20 +28,47 @@ except ImportError:  # pragma: no cover - optional dependency
     TENSORFLOW_AVAILABLE = False
 
 import os
+import threading
 
 
 def _create_sequences(data: np.ndarray, lookback: int) -> tuple[np.ndarray, np.ndarray]:
-    """Create rolling window sequences for LSTM input."""
-    X, y = [], []
-    for i in range(lookback, len(data)):
-        X.append(data[i - lookback : i])
-        # close price is at index 3
-        y.append(data[i, 3])
-    return np.array(X), np.array(y)
+    """
+    Create rolling window sequences for LSTM input.
+
+    `X[i]` is `data[i : i + lookback]` and `y[i]` the close price (index 3)
+    of the following row. `X` is a strided view over `data`, so no window
+    is copied.
+    """
+    windows = sliding_window_view(data[:-1], lookback, axis=0)
+    # (n, features, lookback) -> (n, lookback, features)
+    X = windows.transpose(0, 2, 1)
+    y = data[lookback:, 3]
+    return X, y
+
+
+def _single_step_infer(model: Any, lookback: int) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Wrap `model` in a traced single-sample forward pass.
+
+    `model.predict` builds a `tf.data` pipeline on every call, which
+    dominates the cost of predicting one window. The graph is traced on the
+    first call of the returned function, so it only pays off when that
+    function is kept and called repeatedly (see `_load_cached_predictor`).
+    """
+
+    @tf.function(input_signature=[tf.TensorSpec((1, lookback, 5), tf.float32)])
+    def infer(x):
+        return model(x, training=False)
+
+    return lambda sequence: infer(sequence.astype(np.float32)).numpy()
 
 
 def _train_lstm_model(df: pd.DataFrame, lookback: int = 30, epochs: int = 15) -> Dict[str, Any]:
-    """Core LSTM training and validation copied from Homework 3."""
+    """
+    Core LSTM training and validation copied from Homework 3.
+
+    Expects `df` sorted by date ascending, as prepared by the facade.
+    """
     if not TENSORFLOW_AVAILABLE:
         return {
             "error": "tensorflow_not_installed",
@@ -53,7 +82,6 @@ def _train_lstm_model(df: pd.DataFrame, lookback: int = 30, epochs: int = 15) ->
             "available": len(df),
         }
 
-    df = df.copy().sort_values("date")
     features = df[["open", "high", "low", "close", "volume"]].values
 
     scaler = MinMaxScaler()
@@ -87,17 +115,17 @@ def _train_lstm_model(df: pd.DataFrame, lookback: int = 30, epochs: int = 15) ->
         verbose=0,
     )
 
-    # Evaluate on validation set
-    y_pred = model.predict(X_val, verbose=0)
+    # Evaluate on validation set. Only the close column (index 3) needs to
+    # be unscaled, so invert it directly instead of via a 5-wide dummy.
+    close_min = scaler.data_min_[3]
+    close_range = scaler.data_max_[3] - close_min
+    if close_range == 0:
+        close_range = 1.0
 
-    y_val_actual = y_val.reshape(-1, 1)
-    dummy_val = np.zeros((len(y_val_actual), 5))
-    dummy_val[:, 3] = y_val_actual.flatten()
-    y_val_inv = scaler.inverse_transform(dummy_val)[:, 3]
+    y_pred = model.predict(X_val, verbose=0)
 
-    dummy_pred = np.zeros((len(y_pred), 5))
-    dummy_pred[:, 3] = y_pred.flatten()
-    y_pred_inv = scaler.inverse_transform(dummy_pred)[:, 3]
+    y_val_inv = y_val * close_range + close_min
+    y_pred_inv = y_pred.flatten() * close_range + close_min
 
     rmse = np.sqrt(mean_squared_error(y_val_inv, y_pred_inv))
     mape = mean_absolute_percentage_error(y_val_inv, y_pred_inv) * 100
@@ -105,14 +133,14 @@ def _train_lstm_model(df: pd.DataFrame, lookback: int = 30, epochs: int = 15) ->
 
     # Next-day prediction
     last_sequence = scaled_data[-lookback:].reshape(1, lookback, 5)
+    # `predict` is already warm from the validation pass above.
     next_pred = model.predict(last_sequence, verbose=0)
 
-    dummy_next = np.zeros((1, 5))
-    dummy_next[:, 3] = next_pred.flatten()
-    next_close = scaler.inverse_transform(dummy_next)[0, 3]
+    next_close = next_pred.flatten()[0] * close_range + close_min
 
     return {
         "model": model,
+        "scaler": scaler,
         "metrics": {
             "rmse": round(float(rmse), 2),
             "mape": round(float(mape), 2),
@@ -130,72 +158,281 @@ def _models_dir() -> str:
     return folder
 
 
-def _save_model(model: Any, symbol: str) -> None:
-    """Save trained model to disk for future reuse."""
-    path = os.path.join(_models_dir(), f"{symbol}_lstm.h5")
-    model.save(path)
+def _scaler_path(symbol: str) -> str:
+    return os.path.join(_models_dir(), f"{symbol}_scaler.npz")
+
+
+def _architecture_path(symbol: str) -> str:
+    return os.path.join(_models_dir(), f"{symbol}_lstm.json")
+
+
+def _weights_path(symbol: str) -> str:
+    return os.path.join(_models_dir(), f"{symbol}_lstm.weights.h5")
+
+
+def _tflite_path(symbol: str) -> str:
+    return os.path.join(_models_dir(), f"{symbol}_lstm.tflite")
+
+
+def _save_model(model: Any, scaler: MinMaxScaler, symbol: str) -> None:
+    """
+    Save trained model to disk for future reuse, together with the scaler
+    bounds it was trained with so cached predictions are scaled identically.
+
+    Only the architecture (JSON) and the weights are stored; the optimizer
+    state is not needed for inference and makes reloading much slower.
+    """
+    with open(_architecture_path(symbol), "w") as fh:
+        fh.write(model.to_json())
+    model.save_weights(_weights_path(symbol))
+    np.savez(_scaler_path(symbol), mn=scaler.data_min_, mx=scaler.data_max_)
+    _export_tflite(model, symbol)
+    _forget_cached_predictors(symbol)
+
+
+def _tflite_flatbuffer(model: Any, float16: bool) -> bytes:
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if float16:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    # The relu-activated LSTM layers are not all TFLite builtins.
+    converter.target_spec.supported_ops = [
+        tf.lite.OpsSet.TFLITE_BUILTINS,
+        tf.lite.OpsSet.SELECT_TF_OPS,
+    ]
+    return converter.convert()
+
+
+def _tflite_matches_model(
+    flatbuffer: bytes, model: Any, samples: int = 8, tolerance: float = 1e-2
+) -> bool:
+    """
+    Compare a TFLite export with the Keras model on random input windows.
+
+    Inputs are MinMax-scaled, so uniform `[0, 1)` windows cover the range
+    seen in production. `tolerance` is in scaled close units.
+    """
+    interpreter = tf.lite.Interpreter(model_content=flatbuffer)
+    interpreter.allocate_tensors()
+    predict = _interpreter_predictor(interpreter)
+
+    _, lookback, features = model.input_shape
+    reference = _single_step_infer(model, lookback)
+    windows = np.random.default_rng(0).random((samples, 1, lookback, features))
+    return all(
+        np.allclose(predict(window), reference(window), rtol=0, atol=tolerance)
+        for window in windows
+    )
+
+
+def _export_tflite(model: Any, symbol: str) -> None:
+    """
+    Export an inference-only TFLite copy of the model for cache hits.
+
+    Weights are stored as float16 when that export agrees with the Keras
+    model, halving the model size and the bytes moved per prediction. For
+    some trained models the float16 LSTM kernels drift far from the float32
+    output, so those are exported at full precision instead.
+    Failures are ignored: the Keras weights stay usable as a fallback.
+    """
+    path = _tflite_path(symbol)
+    try:
+        flatbuffer = _tflite_flatbuffer(model, float16=True)
+        if not _tflite_matches_model(flatbuffer, model):
+            flatbuffer = _tflite_flatbuffer(model, float16=False)
+        with open(path, "wb") as fh:
+            fh.write(flatbuffer)
+    except Exception:
+        if os.path.exists(path):
+            # Never serve a stale export next to a freshly trained model.
+            os.remove(path)
 
 
 def _load_cached_model(symbol: str) -> Any | None:
-    """Load a cached Keras model from disk if it exists."""
-    path = os.path.join(_models_dir(), f"{symbol}_lstm.h5")
+    """Rebuild a cached Keras model from its saved architecture and weights."""
+    architecture_path = _architecture_path(symbol)
+    weights_path = _weights_path(symbol)
+    if not (os.path.exists(architecture_path) and os.path.exists(weights_path)):
+        return None
+    try:
+        with open(architecture_path) as fh:
+            model = model_from_json(fh.read())
+        model.load_weights(weights_path)
+        return model
+    except Exception:
+        return None
+
+
+def _interpreter_predictor(
+    interpreter: "tf.lite.Interpreter",
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Single-sample predict function over an allocated TFLite interpreter.
+
+    An interpreter must not be invoked from two threads at once, so calls
+    are serialized on a lock owned by the returned function.
+    """
+    input_index = interpreter.get_input_details()[0]["index"]
+    output_index = interpreter.get_output_details()[0]["index"]
+    lock = threading.Lock()
+
+    def predict(sequence: np.ndarray) -> np.ndarray:
+        with lock:
+            interpreter.set_tensor(input_index, sequence.astype(np.float32))
+            interpreter.invoke()
+            return interpreter.get_tensor(output_index)
+
+    return predict
+
+
+def _load_tflite_predictor(symbol: str) -> Callable[[np.ndarray], np.ndarray] | None:
+    """Build a single-sample predictor from the cached TFLite export, if any."""
+    path = _tflite_path(symbol)
     if not os.path.exists(path):
         return None
     try:
-        return load_model(path)
+        interpreter = tf.lite.Interpreter(model_path=path)
+        interpreter.allocate_tensors()
     except Exception:
         return None
+    return _interpreter_predictor(interpreter)
+
+
+# symbol -> predictor over an allocated TFLite interpreter, and
+# (symbol, lookback) -> traced predictor of a loaded Keras model, so each
+# cached model is loaded once per process. Entries are dropped when the
+# symbol's model is retrained.
+_TFLITE_PREDICTORS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {}
+_KERAS_PREDICTORS: Dict[Tuple[str, int], Callable[[np.ndarray], np.ndarray]] = {}
+
+
+def _forget_cached_predictors(symbol: str) -> None:
+    _TFLITE_PREDICTORS.pop(symbol, None)
+    for key in [key for key in _KERAS_PREDICTORS if key[0] == symbol]:
+        _KERAS_PREDICTORS.pop(key, None)
+
+
+def _load_cached_predictor(
+    symbol: str, lookback: int
+) -> Callable[[np.ndarray], np.ndarray] | None:
+    """
+    Return an inference function for the cached model of `symbol`.
+
+    Prefers the lightweight TFLite interpreter and falls back to the full
+    Keras model.
+    """
+    predictor = _TFLITE_PREDICTORS.get(symbol)
+    if predictor is not None:
+        return predictor
+
+    predictor = _load_tflite_predictor(symbol)
+    if predictor is not None:
+        _TFLITE_PREDICTORS[symbol] = predictor
+        return predictor
+
+    predictor = _KERAS_PREDICTORS.get((symbol, lookback))
+    if predictor is not None:
+        return predictor
+
+    cached_model = _load_cached_model(symbol)
+    if cached_model is None:
+        return None
+    predictor = _single_step_infer(cached_model, lookback)
+    _KERAS_PREDICTORS[(symbol, lookback)] = predictor
+    return predictor
+
+
+def _load_scaler_params(symbol: str) -> tuple[np.ndarray, np.ndarray] | None:
+    """Load the `(data_min, data_max)` feature bounds saved with a cached model."""
+    path = _scaler_path(symbol)
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as params:
+            return params["mn"], params["mx"]
+    except Exception:
+        return None
+
+
+def _predict_from_cache(
+    df: pd.DataFrame, symbol: str, lookback: int
+) -> Dict[str, Any] | None:
+    """
+    Predict with the cached model of `symbol`, or return None when there is
+    no usable cached model.
+    """
+    predictor = _load_cached_predictor(symbol, lookback)
+    scaler_params = _load_scaler_params(symbol) if predictor is not None else None
+    if predictor is None or scaler_params is None:
+        return None
+
+    try:
+        if len(df) < lookback:
+            return {
+                "error": "not_enough_data",
+                "required": lookback,
+                "available": len(df),
+            }
+
+        features = df[["open", "high", "low", "close", "volume"]].values
+
+        # Same transform as the training-time MinMaxScaler, applied
+        # only to the window we predict from.
+        data_min, data_max = scaler_params
+        data_range = data_max - data_min
+        data_range[data_range == 0] = 1.0
+
+        scaled_window = (features[-lookback:] - data_min) / data_range
+        last_sequence = scaled_window.reshape(1, lookback, 5)
+        next_pred = predictor(last_sequence)
+
+        next_close = next_pred.flatten()[0] * data_range[3] + data_min[3]
+
+        return {
+            "cached": True,
+            "prediction": {
+                "next_close": round(float(next_close), 2),
+            },
+        }
+    except Exception:
+        # If cached model fails for any reason, fall back to training a new one
+        return None
 
 
 def _predict_with_lstm(
-    df: pd.DataFrame, symbol: str, lookback: int = 30, epochs: int = 15, use_cache: bool = True
+    df: pd.DataFrame,
+    symbol: str,
+    lookback: int = 30,
+    epochs: int = 15,
+    use_cache: bool = True,
+    allow_training: bool = True,
 ) -> Dict[str, Any]:
     """
     Public function equivalent to Homework 3 `predict_with_lstm`, returning
     either an error dictionary or metrics + prediction (and cache info).
+
+    With `allow_training=False` only a cached model is used; without one the
+    result is a `model_not_cached` error.
     """
     if use_cache:
-        cached_model = _load_cached_model(symbol)
-        if cached_model is not None:
-            try:
-                if len(df) < lookback:
-                    return {
-                        "error": "not_enough_data",
-                        "required": lookback,
-                        "available": len(df),
-                    }
-
-                df = df.sort_values("date")
-                features = df[["open", "high", "low", "close", "volume"]].values
-
-                scaler = MinMaxScaler()
-                scaled_data = scaler.fit_transform(features)
-
-                last_sequence = scaled_data[-lookback:].reshape(1, lookback, 5)
-                next_pred = cached_model.predict(last_sequence, verbose=0)
-
-                dummy_next = np.zeros((1, 5))
-                dummy_next[:, 3] = next_pred.flatten()
-                next_close = scaler.inverse_transform(dummy_next)[0, 3]
-
-                return {
-                    "cached": True,
-                    "prediction": {
-                        "next_close": round(float(next_close), 2),
-                    },
-                }
-            except Exception:
-                # If cached model fails for any reason, fall back to training a new one
-                pass
+        cached = _predict_from_cache(df, symbol, lookback)
+        if cached is not None:
+            return cached
+
+    if not allow_training:
+        return {
+            "error": "model_not_cached",
+            "message": "No cached model; training is required",
+        }
 
     result = _train_lstm_model(df, lookback=lookback, epochs=epochs)
     if "error" in result:
         return result
 
-    model = result.get("model")
-    if model is not None:
-        _save_model(model, symbol)
-        del result["model"]
+    model = result.pop("model", None)
+    scaler = result.pop("scaler", None)
+    if model is not None and scaler is not None:
+        _save_model(model, scaler, symbol)
 
     return result
 
@@ -209,6 +446,7 @@ class LSTMPredictionStrategy(AnalyticsStrategy):
         lookback = int(kwargs.get("lookback", 30))
         epochs = int(kwargs.get("epochs", 15))
         use_cache = bool(kwargs.get("use_cache", True))
+        allow_training = bool(kwargs.get("allow_training", True))
 
         result = _predict_with_lstm(
             df=df,
@@ -216,6 +454,7 @@ class LSTMPredictionStrategy(AnalyticsStrategy):
             lookback=lookback,
             epochs=epochs,
             use_cache=use_cache,
+            allow_training=allow_training,
         )
 
         # Attach symbol and lookback for consistency with HW3 API
@@ -7,13 +7,17 @@ This wraps the Homework 3 `onchain_sentiment` module behind the
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
 import numpy as np
 import pandas as pd
 
+from ...common.cache import async_ttl_cache, ttl_cache
 from .base import AnalyticsStrategy
 
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
 try:
     from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
@@ -35,28 +39,40 @@ try:
 except ImportError:  # pragma: no cover
     REQUESTS_AVAILABLE = False
 
+import asyncio
 import re
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta  # noqa: F401 (kept for parity with HW3)
 
+# Building an analyzer parses the whole VADER lexicon from disk, so one
+# instance is shared by all requests (scoring does not mutate it).
+_VADER = SentimentIntensityAnalyzer() if VADER_AVAILABLE else None
+
+# Shared session so repeated calls reuse TCP/TLS connections.
+_HTTP = requests.Session() if REQUESTS_AVAILABLE else None
+
+
+def _fetch(url: str, headers: Dict[str, str] | None = None) -> requests.Response:
+    return _HTTP.get(url, headers=headers, timeout=5)
 
-def _calculate_onchain_metrics(df: pd.DataFrame, symbol: str) -> Dict[str, Any] | None:
-    if len(df) < 7:
-        return None
 
-    df = df.copy().sort_values("date")
+def _calculate_onchain_metrics(
+    close: np.ndarray, volume: np.ndarray, symbol: str
+) -> Dict[str, Any] | None:
+    if len(close) < 7:
+        return None
 
-    latest = df.iloc[-1]
-    current_price = float(latest["close"])
-    avg_price = df["close"].mean()
+    current_price = float(close[-1])
+    avg_price = float(np.nanmean(close))
 
-    active_addresses = _simulate_active_addresses(df, symbol)
-    transaction_count = len(df)
-    exchange_flows = _calculate_exchange_flows(df)
-    whale_movements = _detect_whale_movements(df)
+    active_addresses = _simulate_active_addresses(close, symbol)
+    transaction_count = len(close)
+    exchange_flows = _calculate_exchange_flows(volume)
+    whale_movements = _detect_whale_movements(volume)
     hash_rate = _get_hash_rate(symbol)
     tvl = _get_tvl(symbol)
-    nvt_ratio = _calculate_nvt_ratio(current_price, df)
+    nvt_ratio = _calculate_nvt_ratio(current_price, volume)
     mvrv_ratio = _calculate_mvrv_ratio(current_price, avg_price)
 
     return {
@@ -71,24 +87,43 @@ def _calculate_onchain_metrics(df: pd.DataFrame, symbol: str) -> Dict[str, Any]
     }
 
 
-def _simulate_active_addresses(df: pd.DataFrame, symbol: str) -> int:
-    recent_volume = df.tail(30)["volume"].mean()
-    base_addresses = {
-        "BTC": 900_000,
-        "ETH": 500_000,
-        "BNB": 200_000,
-        "SOL": 150_000,
-        "XRP": 100_000,
-    }
-
-    base = base_addresses.get(symbol, 50_000)
-    volatility_factor = df.tail(7)["close"].std() / df.tail(7)["close"].mean()
+# Static per-symbol estimates used by the simulated metrics.
+_BASE_ADDRESSES = {
+    "BTC": 900_000,
+    "ETH": 500_000,
+    "BNB": 200_000,
+    "SOL": 150_000,
+    "XRP": 100_000,
+}
+
+_HASH_RATES = {
+    "BTC": 450,
+    "ETH": 0,
+    "LTC": 800,
+    "BCH": 2.5,
+    "BSV": 1.8,
+}
+
+_TVL_ESTIMATES = {
+    "BTC": 48_000_000_000,
+    "ETH": 55_000_000_000,
+    "BNB": 8_000_000_000,
+    "SOL": 4_000_000_000,
+    "AVAX": 2_000_000_000,
+    "MATIC": 1_500_000_000,
+}
+
+
+def _simulate_active_addresses(close: np.ndarray, symbol: str) -> int:
+    base = _BASE_ADDRESSES.get(symbol, 50_000)
+    week_close = close[-7:]
+    volatility_factor = np.nanstd(week_close, ddof=1) / np.nanmean(week_close)
     adjustment = 1 + (volatility_factor * 0.5)
     return int(base * adjustment)
 
 
-def _calculate_exchange_flows(df: pd.DataFrame) -> Dict[str, int]:
-    recent_volumes = df.tail(7)["volume"].values
+def _calculate_exchange_flows(volume: np.ndarray) -> Dict[str, int]:
+    recent_volumes = volume[-7:]
     if len(recent_volumes) < 2:
         return {"inflow": 0, "outflow": 0, "net_flow": 0}
 
@@ -106,12 +141,33 @@ def _calculate_exchange_flows(df: pd.DataFrame) -> Dict[str, int]:
     return {"inflow": inflow, "outflow": outflow, "net_flow": net_flow}
 
 
-def _detect_whale_movements(df: pd.DataFrame) -> str:
-    volumes = df["volume"].values
+def _percentile_95(values: np.ndarray) -> float:
+    """
+    `np.percentile(values, 95)` (linear interpolation) via a partial sort
+    of the two neighbouring order statistics instead of the general
+    quantile machinery.
+    """
+    if np.isnan(values).any():
+        return float("nan")
+
+    position = 0.95 * (len(values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    ordered = np.partition(values, (lower, upper))
+    low, high = ordered[lower], ordered[upper]
+
+    # Same interpolation formula as numpy's percentile.
+    fraction = position - lower
+    if fraction >= 0.5:
+        return float(high - (high - low) * (1 - fraction))
+    return float(low + (high - low) * fraction)
+
+
+def _detect_whale_movements(volumes: np.ndarray) -> str:
     if len(volumes) < 7:
         return "normal"
 
-    percentile_95 = float(np.percentile(volumes, 95))
+    percentile_95 = _percentile_95(volumes)
     latest_volume = float(volumes[-1])
 
     if latest_volume > percentile_95 * 1.5:
@@ -122,26 +178,39 @@ def _detect_whale_movements(df: pd.DataFrame) -> str:
 
 
 def _get_hash_rate(symbol: str) -> float:
-    hash_rates = {
-        "BTC": 450,
-        "ETH": 0,
-        "LTC": 800,
-        "BCH": 2.5,
-        "BSV": 1.8,
-    }
-    return float(hash_rates.get(symbol, 0))
+    return float(_HASH_RATES.get(symbol, 0))
 
 
 def _simulate_tvl(symbol: str) -> int:
-    tvl_estimates = {
-        "BTC": 48_000_000_000,
-        "ETH": 55_000_000_000,
-        "BNB": 8_000_000_000,
-        "SOL": 4_000_000_000,
-        "AVAX": 2_000_000_000,
-        "MATIC": 1_500_000_000,
-    }
-    return int(tvl_estimates.get(symbol, 500_000_000))
+    return int(_TVL_ESTIMATES.get(symbol, 500_000_000))
+
+
+# DefiLlama chain names for symbols whose name differs from the ticker.
+_TVL_CHAINS = {
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "BNB": "bsc",
+    "SOL": "solana",
+    "AVAX": "avalanche",
+}
+
+# On-chain and sentiment inputs change on the order of minutes; results are
+# reused for this long (seconds) instead of being recomputed per request.
+_TVL_TTL_SECONDS = 600
+_SENTIMENT_TTL_SECONDS = 60
+
+
+@ttl_cache(_TVL_TTL_SECONDS)
+def _chain_tvls() -> Dict[str, float]:
+    """
+    Current TVL of every chain tracked by DefiLlama, keyed by lowercase name.
+
+    `/v2/chains` returns one row per chain, unlike `/protocols` which lists
+    every protocol. Failed requests raise and are therefore not cached.
+    """
+    response = _fetch("https://api.llama.fi/v2/chains")
+    response.raise_for_status()
+    return {row["name"].lower(): row.get("tvl", 0) for row in response.json()}
 
 
 def _get_tvl(symbol: str) -> int:
@@ -149,41 +218,21 @@ def _get_tvl(symbol: str) -> int:
         return _simulate_tvl(symbol)
 
     try:
-        response = requests.get("https://api.llama.fi/protocols", timeout=5)
-        if response.status_code == 200:
-            protocols = response.json()
-
-            symbol_map = {
-                "BTC": "bitcoin",
-                "ETH": "ethereum",
-                "BNB": "bsc",
-                "SOL": "solana",
-                "AVAX": "avalanche",
-            }
-
-            chain_name = symbol_map.get(symbol, symbol.lower())
-            total_tvl = 0
-
-            for protocol in protocols:
-                if (
-                    protocol.get("chain") == chain_name
-                    or protocol.get("name", "").lower() == chain_name
-                ):
-                    total_tvl += protocol.get("tvl", 0)
-
-            if total_tvl > 0:
-                return int(total_tvl)
-
+        chain_tvls = _chain_tvls()
+        chain_name = _TVL_CHAINS.get(symbol, symbol.lower())
+        total_tvl = chain_tvls.get(chain_name, 0)
+        if total_tvl > 0:
+            return int(total_tvl)
         return _simulate_tvl(symbol)
     except Exception:
         return _simulate_tvl(symbol)
 
 
-def _calculate_nvt_ratio(current_price: float, df: pd.DataFrame) -> float:
+def _calculate_nvt_ratio(current_price: float, volume: np.ndarray) -> float:
     circulating_supply = 21_000_000
     market_cap = current_price * circulating_supply
 
-    recent_volume = df.tail(30)["volume"].mean()
+    recent_volume = np.nanmean(volume[-30:])
     daily_transaction_value = recent_volume * current_price
 
     if daily_transaction_value > 0:
@@ -198,12 +247,14 @@ def _calculate_mvrv_ratio(current_price: float, avg_price: float) -> float:
     return 1.0
 
 
+# URLs and punctuation are both replaced by a space in a single scan.
+_URL_PUNCT_RE = re.compile(r"https?\S+|www\S+|[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _clean_text(text: str) -> str:
-    text = text.lower()
-    text = re.sub(r"http\S+|www\S+|https\S+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"[^\w\s]", " ", text)
-    text = " ".join(text.split())
-    return text
+    text = _URL_PUNCT_RE.sub(" ", text.lower())
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
 
 def _generate_mock_sentiment_data(symbol: str) -> List[str]:
@@ -249,88 +300,148 @@ def _simulate_sentiment(symbol: str) -> Dict[str, Any]:
     }
 
 
-def _fetch_crypto_news(symbol: str) -> List[str]:
-    if not FEEDPARSER_AVAILABLE:
-        return []
+_RSS_FEEDS = (
+    "https://cointelegraph.com/rss",
+    "https://www.coindesk.com/arc/outboundfeeds/rss/",
+)
+_SUBREDDITS = ("cryptocurrency", "bitcoin", "ethereum", "cryptomarkets")
+_REDDIT_HEADERS = {"User-Agent": "crypto-analytics/1.0"}
 
-    rss_feeds = [
-        "https://cointelegraph.com/rss",
-        "https://www.coindesk.com/arc/outboundfeeds/rss/",
-    ]
 
+def _matching_news(entries: List[Any], symbol: str) -> List[str]:
     news_texts: List[str] = []
+    for entry in entries[:10]:
+        title = entry.get("title", "")
+        summary = entry.get("summary", "")
+        if symbol.lower() in title.lower() or symbol.lower() in summary.lower():
+            news_texts.append(f"{title}. {summary}")
+    return news_texts
+
+
+def _news_from_feed(feed_url: str, symbol: str) -> List[str]:
     try:
-        for feed_url in rss_feeds:
-            feed = feedparser.parse(feed_url)
-            for entry in feed.entries[:10]:
-                title = entry.get("title", "")
-                summary = entry.get("summary", "")
-                if symbol.lower() in title.lower() or symbol.lower() in summary.lower():
-                    news_texts.append(f"{title}. {summary}")
-        return news_texts[:20]
+        feed = feedparser.parse(feed_url)
     except Exception:
         return []
+    return _matching_news(feed.entries, symbol)
 
 
-def _fetch_reddit_sentiment(symbol: str) -> List[str]:
-    if not REQUESTS_AVAILABLE:
+def _subreddit_url(subreddit: str) -> str:
+    return f"https://www.reddit.com/r/{subreddit}/hot.json?limit=25"
+
+
+def _matching_posts(posts: List[Dict[str, Any]], symbol: str) -> List[str]:
+    reddit_texts: List[str] = []
+    for post in posts:
+        post_data = post.get("data", {})
+        title = post_data.get("title", "")
+        selftext = post_data.get("selftext", "")
+        if symbol.upper() in title.upper() or symbol.lower() in title.lower():
+            reddit_texts.append(f"{title}. {selftext}")
+    return reddit_texts
+
+
+def _posts_from_subreddit(subreddit: str, symbol: str) -> List[str]:
+    try:
+        response = _fetch(_subreddit_url(subreddit), headers=_REDDIT_HEADERS)
+        if response.status_code != 200:
+            return []
+        posts = response.json().get("data", {}).get("children", [])
+    except Exception:
+        return []
+    return _matching_posts(posts, symbol)
+
+
+def _fetch_sentiment_texts(symbol: str) -> List[str]:
+    """
+    News and Reddit texts mentioning `symbol`, with all feeds fetched
+    concurrently.
+    """
+    feeds = _RSS_FEEDS if FEEDPARSER_AVAILABLE else ()
+    subreddits = _SUBREDDITS if REQUESTS_AVAILABLE else ()
+    if not feeds and not subreddits:
         return []
 
+    with ThreadPoolExecutor(max_workers=len(feeds) + len(subreddits)) as pool:
+        news = [pool.submit(_news_from_feed, url, symbol) for url in feeds]
+        posts = [pool.submit(_posts_from_subreddit, name, symbol) for name in subreddits]
+        news_texts = [text for future in news for text in future.result()]
+        reddit_texts = [text for future in posts for text in future.result()]
+
+    return news_texts[:20] + reddit_texts[:15]
+
+
+async def _news_from_feed_async(
+    feed_url: str, symbol: str, client: httpx.AsyncClient
+) -> List[str]:
     try:
-        headers = {"User-Agent": "crypto-analytics/1.0"}
-        subreddits = ["cryptocurrency", "bitcoin", "ethereum", "cryptomarkets"]
-        reddit_texts: List[str] = []
-
-        for subreddit in subreddits:
-            url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=25"
-            response = requests.get(url, headers=headers, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                posts = data.get("data", {}).get("children", [])
-                for post in posts:
-                    post_data = post.get("data", {})
-                    title = post_data.get("title", "")
-                    selftext = post_data.get("selftext", "")
-                    if symbol.upper() in title.upper() or symbol.lower() in title.lower():
-                        reddit_texts.append(f"{title}. {selftext}")
-        return reddit_texts[:15]
+        response = await client.get(feed_url)
+        # Parsing is CPU-bound, keep it off the event loop.
+        feed = await asyncio.to_thread(feedparser.parse, response.content)
     except Exception:
         return []
+    return _matching_news(feed.entries, symbol)
 
 
+async def _posts_from_subreddit_async(
+    subreddit: str, symbol: str, client: httpx.AsyncClient
+) -> List[str]:
+    try:
+        response = await client.get(_subreddit_url(subreddit), headers=_REDDIT_HEADERS)
+        if response.status_code != 200:
+            return []
+        posts = response.json().get("data", {}).get("children", [])
+    except Exception:
+        return []
+    return _matching_posts(posts, symbol)
+
+
+async def _fetch_sentiment_texts_async(symbol: str, client: httpx.AsyncClient) -> List[str]:
+    """`_fetch_sentiment_texts` without blocking the event loop."""
+    feeds = _RSS_FEEDS if FEEDPARSER_AVAILABLE else ()
+    news, posts = await asyncio.gather(
+        asyncio.gather(*(_news_from_feed_async(url, symbol, client) for url in feeds)),
+        asyncio.gather(
+            *(_posts_from_subreddit_async(name, symbol, client) for name in _SUBREDDITS)
+        ),
+    )
+    news_texts = [text for texts in news for text in texts]
+    reddit_texts = [text for texts in posts for text in texts]
+    return news_texts[:20] + reddit_texts[:15]
+
+
+@ttl_cache(_SENTIMENT_TTL_SECONDS)
 def _analyze_sentiment(symbol: str) -> Dict[str, Any]:
     if not VADER_AVAILABLE:
         return _simulate_sentiment(symbol)
+    return _score_sentiment(symbol, _fetch_sentiment_texts(symbol))
+
 
-    analyzer = SentimentIntensityAnalyzer()
-    sentiment_texts: List[str] = []
+@async_ttl_cache(_SENTIMENT_TTL_SECONDS)
+async def _analyze_sentiment_async(symbol: str, *, client: httpx.AsyncClient) -> Dict[str, Any]:
+    if not VADER_AVAILABLE:
+        return _simulate_sentiment(symbol)
+    sentiment_texts = await _fetch_sentiment_texts_async(symbol, client)
+    return _score_sentiment(symbol, sentiment_texts)
 
-    sentiment_texts.extend(_fetch_crypto_news(symbol))
-    sentiment_texts.extend(_fetch_reddit_sentiment(symbol))
+
+def _score_sentiment(symbol: str, sentiment_texts: List[str]) -> Dict[str, Any]:
+    analyzer = _VADER
 
     if not sentiment_texts:
         sentiment_texts = _generate_mock_sentiment_data(symbol)
 
-    positive_count = 0
-    neutral_count = 0
-    negative_count = 0
-    compound_scores: List[float] = []
-
-    for text in sentiment_texts:
-        cleaned_text = _clean_text(text)
-        if not cleaned_text:
-            continue
-        scores = analyzer.polarity_scores(cleaned_text)
-        compound = scores["compound"]
-        compound_scores.append(compound)
-        if compound >= 0.05:
-            positive_count += 1
-        elif compound <= -0.05:
-            negative_count += 1
-        else:
-            neutral_count += 1
-
-    avg_score = sum(compound_scores) / len(compound_scores) if compound_scores else 0
+    cleaned_texts = [text for text in map(_clean_text, sentiment_texts) if text]
+    scores = np.fromiter(
+        (analyzer.polarity_scores(text)["compound"] for text in cleaned_texts),
+        dtype=np.float64,
+        count=len(cleaned_texts),
+    )
+
+    positive_count = int((scores >= 0.05).sum())
+    negative_count = int((scores <= -0.05).sum())
+    neutral_count = scores.size - positive_count - negative_count
+    avg_score = float(scores.mean()) if scores.size else 0
 
     if avg_score >= 0.05:
         sentiment_label = "positive"
@@ -352,44 +463,47 @@ def _analyze_sentiment(symbol: str) -> Dict[str, Any]:
 def _generate_combined_signal(
     onchain_metrics: Dict[str, Any], sentiment_data: Dict[str, Any]
 ) -> str:
-    signal_factors: List[int] = []
+    # Running sum and number of the +1 / 0 / -1 signal factors.
+    total = 0
+    count = 1
 
-    # Sentiment contribution
+    # Sentiment contribution (always counted)
     label = sentiment_data.get("label")
     if label == "positive":
-        signal_factors.append(1)
+        total += 1
     elif label == "negative":
-        signal_factors.append(-1)
-    else:
-        signal_factors.append(0)
+        total -= 1
 
     # Whale movements & exchange flows
     whale_movement = onchain_metrics.get("whale_movements", "normal")
     if whale_movement in ("very_high", "high"):
         net_flow = onchain_metrics.get("exchange_flows", {}).get("net_flow", 0)
         if net_flow > 0:
-            signal_factors.append(1)
+            total += 1
+            count += 1
         elif net_flow < 0:
-            signal_factors.append(-1)
+            total -= 1
+            count += 1
 
     # MVRV ratio
     mvrv = onchain_metrics.get("mvrv_ratio", 1.0)
     if mvrv > 1.5:
-        signal_factors.append(1)
+        total += 1
+        count += 1
     elif mvrv < 0.8:
-        signal_factors.append(-1)
+        total -= 1
+        count += 1
 
     # NVT ratio
     nvt = onchain_metrics.get("nvt_ratio", 0)
     if 0 < nvt < 40:
-        signal_factors.append(1)
+        total += 1
+        count += 1
     elif nvt > 80:
-        signal_factors.append(-1)
+        total -= 1
+        count += 1
 
-    if not signal_factors:
-        return "neutral"
-
-    avg_signal = sum(signal_factors) / len(signal_factors)
+    avg_signal = total / count
     if avg_signal > 0.3:
         return "bullish"
     if avg_signal < -0.3:
@@ -404,29 +518,82 @@ class OnchainSentimentStrategy(AnalyticsStrategy):
     """
 
     def analyze(self, df: pd.DataFrame, symbol: str, **_: Any) -> Dict[str, Any]:
-        if len(df) < 7:
-            return {
-                "error": "not_enough_data",
-                "required": 7,
-                "available": len(df),
-                "message": "Insufficient data for on-chain and sentiment analysis",
-            }
-
-        onchain = _calculate_onchain_metrics(df, symbol)
+        return self.analyze_arrays(
+            symbol,
+            close=df["close"].to_numpy(dtype=np.float64),
+            volume=df["volume"].to_numpy(dtype=np.float64),
+        )
+
+    def analyze_arrays(  # type: ignore[override]
+        self, symbol: str, *, close: np.ndarray, volume: np.ndarray
+    ) -> Dict[str, Any]:
+        """
+        Same as `analyze`, for close and volume arrays sorted by date.
+
+        On-chain metrics only use these two columns, so callers can skip
+        building a DataFrame.
+        """
+        if len(close) < 7:
+            return _not_enough_data(len(close))
+
+        onchain = _calculate_onchain_metrics(close, volume, symbol)
         if not onchain:
-            return {
-                "error": "calculation_failed",
-                "message": "Unable to calculate on-chain metrics",
-            }
+            return _calculation_failed()
 
         sentiment = _analyze_sentiment(symbol)
-        combined_signal = _generate_combined_signal(onchain, sentiment)
-
-        return {
-            "symbol": symbol,
-            "on_chain": onchain,
-            "sentiment": sentiment,
-            "combined_signal": combined_signal,
-        }
+        return _combined_result(symbol, onchain, sentiment)
+
+    async def analyze_arrays_async(  # type: ignore[override]
+        self,
+        symbol: str,
+        client: httpx.AsyncClient,
+        *,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ) -> Dict[str, Any]:
+        """
+        Same as `analyze_arrays`, for use from an event loop.
+
+        News and Reddit are fetched with `client` while the on-chain metrics
+        (which may call DefiLlama synchronously) run in a worker thread.
+        """
+        if len(close) < 7:
+            return _not_enough_data(len(close))
+
+        onchain, sentiment = await asyncio.gather(
+            asyncio.to_thread(_calculate_onchain_metrics, close, volume, symbol),
+            _analyze_sentiment_async(symbol, client=client),
+        )
+        if not onchain:
+            return _calculation_failed()
+
+        return _combined_result(symbol, onchain, sentiment)
+
+
+def _not_enough_data(available: int) -> Dict[str, Any]:
+    return {
+        "error": "not_enough_data",
+        "required": 7,
+        "available": available,
+        "message": "Insufficient data for on-chain and sentiment analysis",
+    }
+
+
+def _calculation_failed() -> Dict[str, Any]:
+    return {
+        "error": "calculation_failed",
+        "message": "Unable to calculate on-chain metrics",
+    }
+
+
+def _combined_result(
+    symbol: str, onchain: Dict[str, Any], sentiment: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "on_chain": onchain,
+        "sentiment": sentiment,
+        "combined_signal": _generate_combined_signal(onchain, sentiment),
+    }
 
 
@@ -8,8 +8,10 @@ with other analytics strategies.
 
 from __future__ import annotations
 
+import math
 from typing import Any, Dict, Optional
 
+import numpy as np
 import pandas as pd
 from ta.trend import SMAIndicator, EMAIndicator, WMAIndicator, CCIIndicator, MACD
 from ta.momentum import RSIIndicator, StochasticOscillator
@@ -17,50 +19,69 @@ from ta.volume import MFIIndicator
 
 from .base import AnalyticsStrategy
 
-
-def _calculate_technical_indicators(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+try:
+    from ._ta_kernels import LAST_KEYS, compute_all_last
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    NUMBA_AVAILABLE = False
+
+# Indicator columns read from the last bar of the `ta` path (VWAP is
+# computed as a scalar).
+_INDICATOR_KEYS = [
+    "sma_20",
+    "ema_20",
+    "wma_20",
+    "hma_20",
+    "rsi_14",
+    "macd",
+    "macd_signal",
+    "macd_hist",
+    "stoch_k",
+    "stoch_d",
+    "cci_20",
+    "mfi_14",
+]
+
+
+def _last_bar_with_ta(df: pd.DataFrame) -> Dict[str, float]:
     """
-    Core implementation copied from Homework 3 `technical_analysis.calculate_technical_indicators`.
+    Indicator values of the last bar computed with the `ta` library.
 
-    Returns a dictionary with moving averages, oscillators and trading signals
-    for the last available bar in the DataFrame.
+    Used when Numba is not installed or the data contains missing values.
     """
-    if len(df) < 50:
-        return None
-
+    # The indicators are stored as columns; keep the caller's frame intact.
     df = df.copy()
-    df = df.sort_values("date")
-
-    indicators: Dict[str, Any] = {
-        "ma": {},
-        "oscillators": {},
-        "signals": {},
-    }
 
     # Moving averages
     df["sma_20"] = SMAIndicator(close=df["close"], window=20).sma_indicator()
     df["ema_20"] = EMAIndicator(close=df["close"], window=20).ema_indicator()
-    df["wma_20"] = WMAIndicator(close=df["close"], window=20).wma()
 
-    # VWAP approximation
-    df["typical_price"] = (df["high"] + df["low"] + df["close"]) / 3
-    df["cum_vol"] = df["volume"].cumsum()
-    df["cum_tp_vol"] = (df["typical_price"] * df["volume"]).cumsum()
-    df["vwap"] = df["cum_tp_vol"] / df["cum_vol"]
+    # VWAP approximation over the whole frame. Only the last value is used,
+    # so take the totals instead of cumulative sums; as with `cumsum`,
+    # missing values are skipped except on the last bar.
+    high, low, close, volume = (
+        df[column].to_numpy(dtype=np.float64)
+        for column in ("high", "low", "close", "volume")
+    )
+    tp_volume = (high + low + close) / 3 * volume
+    if np.isnan(tp_volume[-1]):
+        vwap = float("nan")
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = float(np.nansum(tp_volume) / np.nansum(volume))
 
-    # Manual WMA (window 20) for compatibility with original implementation
+    # WMA (window 20) as one convolution with linearly increasing weights;
+    # same weighting as `ta.WMAIndicator`, without its rolling apply.
     n = 20
     if len(df) >= n:
-        wma_values = []
-        for i in range(len(df)):
-            if i < n - 1:
-                wma_values.append(None)
-            else:
-                window_data = df["close"].iloc[i - n + 1 : i + 1]
-                weights = range(1, n + 1)
-                wma = sum(w * p for w, p in zip(weights, window_data)) / sum(weights)
-                wma_values.append(wma)
-        df["wma_20"] = wma_values
+        close = df["close"].to_numpy(dtype=np.float64)
+        weights = np.arange(1, n + 1, dtype=np.float64)
+        weights /= weights.sum()
+        wma = np.convolve(close, weights[::-1], mode="valid")
+        df["wma_20"] = np.concatenate([np.full(n - 1, np.nan), wma])
+    else:
+        df["wma_20"] = np.nan
 
     # Hull Moving Average approximation (period 20)
     hma_period = 20
@@ -69,7 +90,7 @@ def _calculate_technical_indicators(df: pd.DataFrame) -> Optional[Dict[str, Any]
         sqrt_length = int(hma_period ** 0.5)
 
         wma_half = WMAIndicator(close=df["close"], window=half_length).wma()
-        wma_full = WMAIndicator(close=df["close"], window=hma_period).wma()
+        wma_full = df["wma_20"]  # same window as hma_period
 
         raw_hma = 2 * wma_half - wma_full
         df["hma_20"] = WMAIndicator(close=raw_hma, window=sqrt_length).wma()
@@ -101,54 +122,89 @@ def _calculate_technical_indicators(df: pd.DataFrame) -> Optional[Dict[str, Any]
         window=14,
     ).money_flow_index()
 
-    last_row = df.iloc[-1]
+    last = df[_INDICATOR_KEYS].iloc[-1].to_numpy(dtype=np.float64)
+    values = dict(zip(_INDICATOR_KEYS, last.tolist()))
+    values["vwap"] = vwap
+    return values
 
-    # Moving averages
-    indicators["ma"]["sma_20"] = (
-        round(float(last_row["sma_20"]), 2) if pd.notna(last_row["sma_20"]) else None
-    )
-    indicators["ma"]["ema_20"] = (
-        round(float(last_row["ema_20"]), 2) if pd.notna(last_row["ema_20"]) else None
-    )
-    indicators["ma"]["wma_20"] = (
-        round(float(last_row["wma_20"]), 2) if pd.notna(last_row["wma_20"]) else None
-    )
-    indicators["ma"]["hma_20"] = (
-        round(float(last_row["hma_20"]), 2) if pd.notna(last_row["hma_20"]) else None
-    )
-    indicators["ma"]["vwap"] = (
-        round(float(last_row["vwap"]), 2) if pd.notna(last_row["vwap"]) else None
+
+def _last_bar(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray
+) -> Dict[str, float]:
+    """
+    Indicator values of the last bar of date-sorted OHLCV arrays (see
+    `AnalyticsStrategy.analyze`).
+
+    Uses the fused Numba kernel when available; it only handles finite
+    input, so data with missing values goes through `ta`. Missing values
+    are NaN.
+    """
+    arrays = (high, low, close, volume)
+    if NUMBA_AVAILABLE and all(np.isfinite(array).all() for array in arrays):
+        return dict(zip(LAST_KEYS, compute_all_last(*arrays)))
+    return _last_bar_with_ta(
+        pd.DataFrame({"high": high, "low": low, "close": close, "volume": volume})
     )
 
+
+def _value(x: float) -> Optional[float]:
+    return None if math.isnan(x) else x
+
+
+def _r(x: float) -> Optional[float]:
+    return None if math.isnan(x) else round(x, 2)
+
+
+def _calculate_technical_indicators_from_arrays(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray
+) -> Optional[Dict[str, Any]]:
+    """
+    Port of Homework 3 `technical_analysis.calculate_technical_indicators`
+    over float64 column arrays.
+
+    Returns a dictionary with moving averages, oscillators and trading signals
+    for the last available bar.
+    """
+    if len(close) < 50:
+        return None
+
+    indicators: Dict[str, Any] = {
+        "ma": {},
+        "oscillators": {},
+        "signals": {},
+    }
+
+    last_row = _last_bar(high, low, close, volume)
+
+    # Moving averages
+    for key in ("sma_20", "ema_20", "wma_20", "hma_20", "vwap"):
+        indicators["ma"][key] = _r(last_row[key])
+
     # Oscillators
-    rsi_val = float(last_row["rsi_14"]) if pd.notna(last_row["rsi_14"]) else None
+    rsi_val = _value(last_row["rsi_14"])
     indicators["oscillators"]["rsi_14"] = round(rsi_val, 2) if rsi_val else None
 
-    if pd.notna(last_row.get("macd")) and pd.notna(last_row.get("macd_signal")):
+    if not math.isnan(last_row["macd"]) and not math.isnan(last_row["macd_signal"]):
         indicators["oscillators"]["macd"] = {
-            "macd": round(float(last_row["macd"]), 2),
-            "signal": round(float(last_row["macd_signal"]), 2),
-            "hist": (
-                round(float(last_row["macd_hist"]), 2)
-                if pd.notna(last_row.get("macd_hist"))
-                else None
-            ),
+            "macd": round(last_row["macd"], 2),
+            "signal": round(last_row["macd_signal"], 2),
+            "hist": _r(last_row["macd_hist"]),
         }
     else:
         indicators["oscillators"]["macd"] = None
 
-    if pd.notna(last_row.get("stoch_k")) and pd.notna(last_row.get("stoch_d")):
+    if not math.isnan(last_row["stoch_k"]) and not math.isnan(last_row["stoch_d"]):
         indicators["oscillators"]["stochastic"] = {
-            "k": round(float(last_row["stoch_k"]), 2),
-            "d": round(float(last_row["stoch_d"]), 2),
+            "k": round(last_row["stoch_k"], 2),
+            "d": round(last_row["stoch_d"], 2),
         }
     else:
         indicators["oscillators"]["stochastic"] = None
 
-    cci_val = float(last_row["cci_20"]) if pd.notna(last_row["cci_20"]) else None
+    cci_val = _value(last_row["cci_20"])
     indicators["oscillators"]["cci_20"] = round(cci_val, 2) if cci_val else None
 
-    mfi_val = float(last_row["mfi_14"]) if pd.notna(last_row["mfi_14"]) else None
+    mfi_val = _value(last_row["mfi_14"])
     indicators["oscillators"]["mfi_14"] = round(mfi_val, 2) if mfi_val else None
 
     # Signals
@@ -218,12 +274,35 @@ class TechnicalAnalysisStrategy(AnalyticsStrategy):
     """Strategy for computing technical indicators on OHLCV data."""
 
     def analyze(self, df: pd.DataFrame, symbol: str, **_: Any) -> Dict[str, Any]:
-        indicators = _calculate_technical_indicators(df)
+        return self.analyze_arrays(
+            symbol,
+            high=df["high"].to_numpy(dtype=np.float64),
+            low=df["low"].to_numpy(dtype=np.float64),
+            close=df["close"].to_numpy(dtype=np.float64),
+            volume=df["volume"].to_numpy(dtype=np.float64),
+        )
+
+    def analyze_arrays(  # type: ignore[override]
+        self,
+        symbol: str,
+        *,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ) -> Dict[str, Any]:
+        """
+        Same as `analyze`, for float64 OHLCV column arrays sorted by date.
+
+        The indicators only use these four columns, so callers can skip
+        building a DataFrame.
+        """
+        indicators = _calculate_technical_indicators_from_arrays(high, low, close, volume)
         if not indicators:
             return {
                 "error": "not_enough_data",
                 "required": 50,
-                "available": len(df),
+                "available": len(close),
             }
         return {
             "symbol": symbol,
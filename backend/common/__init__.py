@@ -2,7 +2,8 @@
 Common utilities shared across Homework 4 microservices.
 
 Currently exposes database helpers for reading OHLCV data from the
-SQLite database populated by the Homework 3 data pipeline.
+SQLite database populated by the Homework 3 data pipeline, and a small
+TTL cache for results that only change every few minutes.
 """
 
 
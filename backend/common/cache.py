@@ -0,0 +1,96 @@
+"""
+Small in-process caching helpers shared by the analytics strategies.
+"""
+
+import threading
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+A = TypeVar("A", bound=Callable[..., Awaitable[Any]])
+
+
+def ttl_cache(seconds: float) -> Callable[[F], F]:
+    """
+    Memoize a function of hashable positional arguments for `seconds`.
+
+    The cache is shared by all threads of the process. Exceptions are not
+    cached, so a failed call is retried on the next request. Concurrent
+    misses for the same arguments may both run the function; the last
+    result wins.
+
+    The wrapped function gets a `cache_clear()` method.
+
+    Example usage:
+        @ttl_cache(60)
+        def load(symbol: str) -> dict:
+            ...
+    """
+
+    def decorator(func: F) -> F:
+        entries: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args: Hashable) -> Any:
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = func(*args)
+            with lock:
+                # Drop expired entries so the cache stays bounded by the
+                # number of keys used within one TTL window.
+                for key in [key for key, (expires, _) in entries.items() if expires <= now]:
+                    del entries[key]
+                entries[args] = (now + seconds, value)
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def async_ttl_cache(seconds: float) -> Callable[[A], A]:
+    """
+    `ttl_cache` for coroutine functions.
+
+    The key is built from the positional arguments only; keyword arguments
+    (e.g. a shared HTTP client) are passed through to the function.
+
+    Example usage:
+        @async_ttl_cache(60)
+        async def load(symbol: str, *, client: httpx.AsyncClient) -> dict:
+            ...
+    """
+
+    def decorator(func: A) -> A:
+        entries: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+
+        @wraps(func)
+        async def wrapper(*args: Hashable, **kwargs: Any) -> Any:
+            # Only touched from the event loop thread, so no lock is needed.
+            now = time.monotonic()
+            entry = entries.get(args)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = await func(*args, **kwargs)
+            now = time.monotonic()
+            for key in [key for key, (expires, _) in entries.items() if expires <= now]:
+                del entries[key]
+            entries[args] = (now + seconds, value)
+            return value
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
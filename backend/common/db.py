@@ -9,8 +9,12 @@ but the path can be overridden via the `CRYPTO_DB_PATH` environment variable.
 """
 
 import os
+import queue
 import sqlite3
-from typing import Generator
+import threading
+from typing import Any, Generator, Sequence
+
+import numpy as np
 
 from .. import config
 
@@ -26,6 +30,27 @@ def get_db_path() -> str:
     return os.getenv("CRYPTO_DB_PATH", config.DB_NAME)
 
 
+# Prepared statements kept per long-lived connection (sqlite3's default is
+# 128). The gateway's `IN (...)` queries differ by placeholder count, so
+# one connection can see many distinct statements.
+_CACHED_STATEMENTS = 256
+
+
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    """
+    Per-connection read tuning: memory-map the file (256 MiB by default) so
+    hot pages are read without `read()` syscalls, keep a page cache (64 MiB
+    by default) and hold temporary b-trees (sorts, CTEs) in memory.
+
+    Both sizes come from `config.SQLITE_MMAP_SIZE` / `config.SQLITE_CACHE_KIB`.
+    """
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA mmap_size = {config.SQLITE_MMAP_SIZE:d}")
+    # A negative cache_size is a size in KiB rather than a page count.
+    conn.execute(f"PRAGMA cache_size = -{config.SQLITE_CACHE_KIB:d}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+
+
 def get_connection() -> sqlite3.Connection:
     """
     Create a new SQLite connection using the configured database path.
@@ -34,10 +59,87 @@ def get_connection() -> sqlite3.Connection:
     """
     db_path = get_db_path()
     conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    _configure_connection(conn)
     return conn
 
 
+# Column dtypes for OHLCV frames read with `pd.read_sql_query(..., dtype=...)`.
+# Without them a window whose values are all NULL comes back as `object`.
+OHLCV_DTYPES = {
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "float64",
+}
+
+
+def read_float_columns(
+    conn: sqlite3.Connection, sql: str, params: Sequence[Any], ncols: int
+) -> np.ndarray:
+    """
+    Run `sql` and return its `ncols` numeric result columns as a
+    `(ncols, n_rows)` float64 array; NULL becomes NaN.
+
+    Rows are copied from the cursor into the array one at a time, without
+    first materialising the whole result as a list of tuples.
+
+    Example usage:
+        close, volume = read_float_columns(conn, "SELECT close, volume ...", (symbol,), 2)
+    """
+    rows = np.fromiter(
+        conn.execute(sql, params), dtype=np.dtype((np.float64, ncols)), count=-1
+    )
+    # One contiguous array per column.
+    return np.ascontiguousarray(rows.T)
+
+
+# Index backing the services' `WHERE symbol = ? ORDER BY date DESC` queries.
+# It also holds every OHLCV column, so those queries are answered from the
+# index alone and never read the table rows.
+_INDEXES = (
+    f"CREATE INDEX IF NOT EXISTS idx_{config.TABLE_NAME}_symbol_date_cover "
+    f"ON {config.TABLE_NAME}(symbol, date DESC, open, high, low, close, volume)",
+)
+
+# Superseded by the covering index above (same leading columns).
+_OBSOLETE_INDEXES = (f"idx_{config.TABLE_NAME}_symbol_date",)
+
+
+def ensure_indexes(conn: sqlite3.Connection) -> None:
+    """Create the indexes used by the hot-path queries if they are missing."""
+    for name in _OBSOLETE_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    for statement in _INDEXES:
+        conn.execute(statement)
+    conn.commit()
+
+
+def init_database() -> None:
+    """
+    One-time database setup, run on service startup:
+    - switch to WAL journaling so concurrent readers never block each other
+    - create the hot-path indexes (see `ensure_indexes`)
+
+    The database is usually mounted read-only (see docker-compose.yml). In
+    that case the setup is skipped and is expected to be done by the
+    Homework 3 pipeline that owns the file. A database that cannot be
+    opened yet does not stop the service from starting either.
+    """
+    try:
+        conn = get_connection()
+    except sqlite3.OperationalError:
+        return
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        ensure_indexes(conn)
+    except sqlite3.OperationalError:
+        pass
+    finally:
+        conn.close()
+
+
 def connection_scope() -> Generator[sqlite3.Connection, None, None]:
     """
     Context-style generator that yields a database connection and
@@ -54,3 +156,61 @@ def connection_scope() -> Generator[sqlite3.Connection, None, None]:
         conn.close()
 
 
+# Idle connections handed out by `get_db`. Connections are reused across
+# requests instead of being opened and closed every time.
+_pool: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+
+
+def _open_pooled_connection() -> sqlite3.Connection:
+    # FastAPI may run a dependency and its endpoint on different worker
+    # threads, so pooled connections must not be bound to their creator.
+    conn = sqlite3.connect(
+        get_db_path(), check_same_thread=False, cached_statements=_CACHED_STATEMENTS
+    )
+    _configure_connection(conn)
+    return conn
+
+
+def get_db() -> Generator[sqlite3.Connection, None, None]:
+    """
+    FastAPI dependency that yields a pooled database connection.
+
+    Each request gets exclusive use of one connection, which goes back to
+    the pool afterwards. The pool grows on demand up to the number of
+    concurrent requests.
+
+    Example usage:
+        @app.get("/coins")
+        def get_coins(conn: sqlite3.Connection = Depends(get_db)):
+            ...
+    """
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _open_pooled_connection()
+    try:
+        yield conn
+    finally:
+        _pool.put(conn)
+
+
+# Per-thread connections handed out by `get_shared_connection`.
+_local = threading.local()
+
+
+def get_shared_connection() -> sqlite3.Connection:
+    """
+    Long-lived read-only connection owned by the calling thread.
+
+    Each worker thread opens its connection on first use and keeps it for
+    the lifetime of the process, so requests no longer pay for opening the
+    file and loading the schema. The returned connection must not be closed.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(get_db_path(), cached_statements=_CACHED_STATEMENTS)
+        _configure_connection(conn)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA query_only = 1")
+        _local.conn = conn
+    return conn
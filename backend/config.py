@@ -6,6 +6,8 @@ data model and SQLite database, but keeps the code physically
 separate so Homework 3 remains unchanged.
 """
 
+import os
+
 COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
 COINS_MARKETS_ENDPOINT = f"{COINGECKO_BASE_URL}/coins/markets"
 COIN_OHLC_ENDPOINT = f"{COINGECKO_BASE_URL}/coins/{{coin_id}}/ohlc"
@@ -26,4 +28,17 @@ RATE_LIMIT_DELAY = 1.0
 DB_NAME = "homework-1-main-homework3/homework3/crypto_data.db"
 TABLE_NAME = "crypto_data"
 
+# SQLite read tuning per connection: bytes of the file to memory-map and
+# page cache size in KiB. Raise them for databases larger than 256 MiB.
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_KIB = int(os.getenv("SQLITE_CACHE_KIB", str(64 * 1024)))
 
+# Origins allowed by the services' CORS middleware, comma-separated in the
+# ALLOWED_ORIGINS env var (e.g. the public frontend URL). Credentials are
+# only allowed for an explicit list, never together with the "*" default.
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",")
+    if origin.strip()
+]
+ALLOW_CREDENTIALS = "*" not in ALLOWED_ORIGINS
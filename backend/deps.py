@@ -0,0 +1,23 @@
+"""
+FastAPI dependencies shared by the microservices.
+"""
+
+from functools import lru_cache
+
+from .analytics.facade import AnalyticsFacade
+
+
+@lru_cache(maxsize=None)
+def get_facade() -> AnalyticsFacade:
+    """
+    FastAPI dependency returning the process-wide analytics facade.
+
+    The facade and its strategies (with their VADER analyzer and cached
+    models) are built on first use and shared by all requests.
+
+    Example usage:
+        @app.get("/technical/{symbol}")
+        def get_technical(symbol: str, facade: AnalyticsFacade = Depends(get_facade)):
+            ...
+    """
+    return AnalyticsFacade()
@@ -20,7 +20,7 @@ function CompareContent() {
   useEffect(() => {
     fetch(`${API_URL}/coins?limit=100`)
       .then(r => r.json())
-      .then(data => setCoins(data))
+      .then(data => setCoins(data.items || []))
       .catch(console.error)
   }, [])
 
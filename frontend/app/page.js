@@ -15,7 +15,7 @@ export default function Dashboard() {
     fetch(`${API_URL}/coins?limit=100`)
       .then(res => res.json())
       .then(data => {
-        setCoins(Array.isArray(data) ? data : [])
+        setCoins(Array.isArray(data?.items) ? data.items : [])
         setLoading(false)
       })
       .catch(err => {
@@ -1,23 +1,63 @@
-from fastapi import FastAPI, HTTPException
+import threading
+from concurrent import futures
+from typing import Any, Dict, Tuple
+
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import pandas as pd
 
 from backend import config
-from backend.common.db import get_connection
+from backend.common.db import OHLCV_DTYPES, get_shared_connection, init_database
 from backend.analytics.facade import AnalyticsFacade
+from backend.deps import get_facade
 
 
-app = FastAPI(title="LSTM Prediction Service", version="1.0.0")
+app = FastAPI(
+    title="LSTM Prediction Service",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=config.ALLOWED_ORIGINS,
+    allow_credentials=config.ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-facade = AnalyticsFacade()
+# Predictions from an already trained model run inline. Training a model
+# can take tens of seconds, so it runs on a dedicated thread and a request
+# only waits for it briefly (long enough for quick errors such as too
+# little data); otherwise the client gets a "queued" or "training" status
+# and can poll `/predict/{symbol}/status`.
+_TRAINING_POOL = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="lstm")
+_INLINE_WAIT_SECONDS = 2.0
+
+_LOCK = threading.Lock()
+# (symbol, lookback) -> (date of the newest input row, prediction)
+_PRED_CACHE: Dict[Tuple[str, int], Tuple[str, Dict[str, Any]]] = {}
+# (symbol, lookback) -> latest training job
+_JOBS: Dict[Tuple[str, int], futures.Future] = {}
+
+
+# Newest 500 rows, returned oldest first as the strategies expect.
+_OHLCV_SQL = f"""
+    SELECT date, open, high, low, close, volume FROM (
+        SELECT date, open, high, low, close, volume
+        FROM {config.TABLE_NAME}
+        WHERE symbol = ?
+        ORDER BY date DESC
+        LIMIT 500
+    )
+    ORDER BY date ASC
+"""
+
+
+@app.on_event("startup")
+def prepare_database() -> None:
+    init_database()
 
 
 @app.get("/health")
@@ -25,15 +65,82 @@ def health() -> dict:
     return {"status": "ok", "service": "lstm_prediction"}
 
 
+def _run_prediction(
+    facade: AnalyticsFacade,
+    key: Tuple[str, int],
+    as_of: str,
+    df: pd.DataFrame,
+    epochs: int,
+    use_cache: bool,
+) -> Dict[str, Any]:
+    symbol, lookback = key
+    result = facade.get_prediction(
+        symbol=symbol,
+        df=df,
+        lookback=lookback,
+        epochs=epochs,
+        use_cache=use_cache,
+    )
+    _remember(key, as_of, result)
+    return result
+
+
+def _remember(key: Tuple[str, int], as_of: str, result: Dict[str, Any]) -> None:
+    if "error" not in result:
+        with _LOCK:
+            _PRED_CACHE[key] = (as_of, result)
+
+
+def _submit_prediction(
+    facade: AnalyticsFacade,
+    key: Tuple[str, int],
+    as_of: str,
+    df: pd.DataFrame,
+    epochs: int,
+    use_cache: bool,
+) -> futures.Future:
+    """Start a training job for `key`, or join the one already queued or running."""
+    with _LOCK:
+        job = _JOBS.get(key)
+        if job is None or job.done():
+            job = _TRAINING_POOL.submit(
+                _run_prediction, facade, key, as_of, df, epochs, use_cache
+            )
+            _JOBS[key] = job
+    return job
+
+
+def _pending_status(job: futures.Future) -> str:
+    return "training" if job.running() else "queued"
+
+
+def _job_status(key: Tuple[str, int], status: str) -> Dict[str, Any]:
+    symbol, lookback = key
+    return {
+        "symbol": symbol,
+        "lookback": lookback,
+        "status": status,
+        "job_id": f"{symbol}:{lookback}",
+    }
+
+
 @app.get("/predict/{symbol}")
 def get_price_prediction(
-    symbol: str, lookback: int = 30, epochs: int = 15, use_cache: bool = True
+    symbol: str,
+    lookback: int = 30,
+    epochs: int = 15,
+    use_cache: bool = True,
+    facade: AnalyticsFacade = Depends(get_facade),
 ) -> dict:
     """
     LSTM-based next-close prediction for `symbol`.
 
     This mirrors the Homework 3 `/coins/{coin_id}/predict` endpoint, but
     is isolated as a dedicated microservice.
+
+    Results are cached per `(symbol, lookback)` until a newer OHLCV row is
+    stored. When a model has to be trained, the response is a
+    `{"status": "queued" | "training"}` payload instead of the prediction.
     """
     symbol = symbol.upper()
 
@@ -45,41 +152,68 @@ def get_price_prediction(
         raise HTTPException(status_code=400, detail="Epochs must be between 5 and 50")
 
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            f"""
-            SELECT date, open, high, low, close, volume
-            FROM {config.TABLE_NAME}
-            WHERE symbol = ?
-            ORDER BY date DESC
-            LIMIT 500
-        """,
-            (symbol,),
-        )
-        rows = cursor.fetchall()
-        conn.close()
-
-        if not rows:
-            raise HTTPException(status_code=404, detail="Coin not found")
+        conn = get_shared_connection()
 
-        df = pd.DataFrame(
-            rows, columns=["date", "open", "high", "low", "close", "volume"]
+        df = pd.read_sql_query(
+            _OHLCV_SQL,
+            conn,
+            params=(symbol,),
+            dtype=OHLCV_DTYPES,
         )
 
-        result = facade.get_prediction(
-            symbol=symbol,
-            df=df,
-            lookback=lookback,
-            epochs=epochs,
-            use_cache=use_cache,
-        )
+        if df.empty:
+            raise HTTPException(status_code=404, detail="Coin not found")
 
-        return result
+        key = (symbol, lookback)
+        as_of = df["date"].iloc[-1]
+        if use_cache:
+            with _LOCK:
+                cached = _PRED_CACHE.get(key)
+            if cached is not None and cached[0] == as_of:
+                return cached[1]
+
+            # A cached model answers in milliseconds; never queue it behind
+            # another symbol's training.
+            result = facade.get_prediction(
+                symbol=symbol,
+                df=df,
+                lookback=lookback,
+                epochs=epochs,
+                use_cache=True,
+                allow_training=False,
+            )
+            if result.get("error") != "model_not_cached":
+                _remember(key, as_of, result)
+                return result
+
+        job = _submit_prediction(facade, key, as_of, df, epochs, use_cache)
+        try:
+            return job.result(timeout=_INLINE_WAIT_SECONDS)
+        except futures.TimeoutError:
+            return _job_status(key, _pending_status(job))
     except HTTPException:
         raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@app.get("/predict/{symbol}/status")
+def get_prediction_status(symbol: str, lookback: int = 30) -> dict:
+    """
+    State of the latest training job for `symbol` and `lookback`
+    ("queued", "training", "failed" or "done"), with the prediction once
+    it has finished.
+    """
+    key = (symbol.upper(), lookback)
+    with _LOCK:
+        job = _JOBS.get(key)
+    if job is None:
+        raise HTTPException(status_code=404, detail="No prediction job found")
+
+    if not job.done():
+        return _job_status(key, _pending_status(job))
+
+    exc = job.exception()
+    if exc is not None:
+        return {**_job_status(key, "failed"), "detail": str(exc)}
+    return {**_job_status(key, "done"), "result": job.result()}
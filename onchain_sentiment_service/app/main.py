@@ -1,23 +1,59 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-import pandas as pd
+from fastapi.responses import ORJSONResponse
+import httpx
+import numpy as np
 
 from backend import config
-from backend.common.db import get_connection
+from backend.common.db import get_shared_connection, init_database, read_float_columns
 from backend.analytics.facade import AnalyticsFacade
+from backend.deps import get_facade
 
 
-app = FastAPI(title="On-chain & Sentiment Service", version="1.0.0")
+app = FastAPI(
+  title="On-chain & Sentiment Service",
+  version="1.0.0",
+  default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=config.ALLOWED_ORIGINS,
+    allow_credentials=config.ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-facade = AnalyticsFacade()
+
+# Newest 365 rows, returned oldest first as the strategy expects.
+_CLOSE_VOLUME_SQL = f"""
+    SELECT close, volume FROM (
+        SELECT date, close, volume
+        FROM {config.TABLE_NAME}
+        WHERE symbol = ?
+        ORDER BY date DESC
+        LIMIT 365
+    )
+    ORDER BY date ASC
+"""
+
+
+@app.on_event("startup")
+def prepare_database() -> None:
+  init_database()
+
+
+@app.on_event("startup")
+async def open_http_client() -> None:
+  # Shared by all requests for the news/Reddit fetches. Feed URLs may redirect.
+  app.state.client = httpx.AsyncClient(timeout=5, follow_redirects=True)
+
+
+@app.on_event("shutdown")
+async def close_http_client() -> None:
+  await app.state.client.aclose()
 
 
 @app.get("/health")
@@ -25,8 +61,22 @@ def health() -> dict:
   return {"status": "ok", "service": "onchain_sentiment"}
 
 
+def _read_close_volume(symbol: str) -> np.ndarray | None:
+  """Close and volume of the newest 365 rows, oldest first, as a (2, n) array."""
+  conn = get_shared_connection()
+
+  # On-chain metrics only need these two columns: read them straight
+  # into float arrays (NULL becomes NaN) instead of building a DataFrame.
+  data = read_float_columns(conn, _CLOSE_VOLUME_SQL, (symbol,), 2)
+  if not data.shape[1]:
+    return None
+  return data
+
+
 @app.get("/onchain-sentiment/{symbol}")
-def get_onchain_sentiment(symbol: str) -> dict:
+async def get_onchain_sentiment(
+    symbol: str, facade: AnalyticsFacade = Depends(get_facade)
+) -> dict:
   """
   Combined on-chain metrics and sentiment analysis for `symbol`.
 
@@ -36,34 +86,17 @@ def get_onchain_sentiment(symbol: str) -> dict:
   symbol = symbol.upper()
 
   try:
-      conn = get_connection()
-      cursor = conn.cursor()
-
-      cursor.execute(
-          f"""
-          SELECT date, open, high, low, close, volume
-          FROM {config.TABLE_NAME}
-          WHERE symbol = ?
-          ORDER BY date DESC
-          LIMIT 365
-      """,
-          (symbol,),
-      )
-      rows = cursor.fetchall()
-      conn.close()
-
-      if not rows:
+      # SQLite calls block, so they run in a worker thread.
+      data = await asyncio.to_thread(_read_close_volume, symbol)
+      if data is None:
           raise HTTPException(status_code=404, detail="Coin not found")
 
-      df = pd.DataFrame(
-          rows, columns=["date", "open", "high", "low", "close", "volume"]
+      close, volume = data
+      result = await facade.get_onchain_sentiment_async(
+          symbol=symbol, close=close, volume=volume, client=app.state.client
       )
-
-      result = facade.get_onchain_sentiment(symbol=symbol, df=df)
       return result
   except HTTPException:
       raise
   except Exception as exc:
       raise HTTPException(status_code=500, detail=str(exc))
-
-
@@ -1,23 +1,127 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-import pandas as pd
+from fastapi.responses import ORJSONResponse
+import numpy as np
 
 from backend import config
-from backend.common.db import get_connection
+from backend.common.db import get_shared_connection, init_database, read_float_columns
 from backend.analytics.facade import AnalyticsFacade
+from backend.deps import get_facade
 
 
-app = FastAPI(title="Technical Analysis Service", version="1.0.0")
+app = FastAPI(
+    title="Technical Analysis Service",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=config.ALLOWED_ORIGINS,
+    allow_credentials=config.ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-facade = AnalyticsFacade()
+_TIMEFRAMES = frozenset({"1d", "1w", "1m"})
+
+# Indicators only change when a new daily candle is stored, so results are
+# reused for a while instead of re-reading 200 rows and recomputing every
+# indicator per request. The ingestion pipeline can drop a symbol's entries
+# early through `POST /technical/{symbol}/invalidate`.
+_CACHE_TTL_SECONDS = 60
+
+_LOCK = threading.Lock()
+# (symbol, timeframe) -> (expiry on the monotonic clock, result)
+_RESULT_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+# (symbol, timeframe) -> computation in progress; concurrent misses for the
+# same key await it instead of repeating the query and the indicators.
+# Only touched from the event loop.
+_INFLIGHT: Dict[Tuple[str, str], "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+# We pull up to 200 records like in Homework 3, enough for all indicators,
+# returned oldest first as the strategies expect. Only the columns the
+# indicators use are selected. Built once so every
+# request hits the connection's prepared-statement cache with the same text.
+_OHLCV_SQL = f"""
+    SELECT high, low, close, volume FROM (
+        SELECT date, high, low, close, volume
+        FROM {config.TABLE_NAME}
+        WHERE symbol = ?
+        ORDER BY date DESC
+        LIMIT 200
+    )
+    ORDER BY date ASC
+"""
+
+
+# Symbols stored in the database, reloaded periodically so unknown
+# symbols get a 404 without a query. None until the first load succeeds.
+_SYMBOLS_REFRESH_SECONDS = 60
+_KNOWN_SYMBOLS: Optional[FrozenSet[str]] = None
+_SYMBOLS_SQL = f"SELECT DISTINCT symbol FROM {config.TABLE_NAME}"
+_SYMBOL_EXISTS_SQL = f"SELECT 1 FROM {config.TABLE_NAME} WHERE symbol = ? LIMIT 1"
+
+
+def _load_symbols() -> FrozenSet[str]:
+    conn = get_shared_connection()
+    return frozenset(row[0] for row in conn.execute(_SYMBOLS_SQL))
+
+
+def _symbol_exists(symbol: str) -> bool:
+    conn = get_shared_connection()
+    return conn.execute(_SYMBOL_EXISTS_SQL, (symbol,)).fetchone() is not None
+
+
+async def _refresh_symbols() -> None:
+    global _KNOWN_SYMBOLS
+    while True:
+        try:
+            _KNOWN_SYMBOLS = await asyncio.to_thread(_load_symbols)
+        except Exception:
+            # Keep the previous set (before the first load, requests
+            # go to the database as usual).
+            pass
+        await asyncio.sleep(_SYMBOLS_REFRESH_SECONDS)
+
+
+@app.on_event("startup")
+def prepare_database() -> None:
+    init_database()
+
+
+@app.on_event("startup")
+async def start_symbol_refresh() -> None:
+    app.state.symbols_task = asyncio.create_task(_refresh_symbols())
+
+
+@app.on_event("shutdown")
+async def stop_symbol_refresh() -> None:
+    app.state.symbols_task.cancel()
+
+
+@app.on_event("startup")
+def warm_up_indicators() -> None:
+    # The first call compiles (or loads from Numba's on-disk cache) the
+    # indicator kernels; pay that before serving instead of on the first
+    # request. Small random walk, long enough for every indicator.
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 200))
+    spread = rng.random(200)
+    get_facade().get_technical_from_arrays(
+        symbol="WARMUP",
+        high=close + spread,
+        low=close - spread,
+        close=close,
+        volume=rng.random(200) * 1_000,
+    )
 
 
 @app.get("/health")
@@ -25,57 +129,101 @@ def health() -> dict:
     return {"status": "ok", "service": "technical_analysis"}
 
 
+def _compute_technical(
+    facade: AnalyticsFacade, symbol: str, timeframe: str
+) -> Dict[str, Any]:
+    """Read the OHLCV window for `symbol` and compute its indicators."""
+    conn = get_shared_connection()
+
+    # Float columns instead of a DataFrame (NULL becomes NaN).
+    high, low, close, volume = read_float_columns(conn, _OHLCV_SQL, (symbol,), 4)
+
+    if not len(close):
+        raise HTTPException(status_code=404, detail="Coin not found")
+
+    return facade.get_technical_from_arrays(
+        symbol=symbol,
+        high=high,
+        low=low,
+        close=close,
+        volume=volume,
+        timeframe=timeframe,
+    )
+
+
 @app.get("/technical/{symbol}")
-def get_technical(symbol: str, timeframe: str = "1m") -> dict:
+async def get_technical(
+    symbol: str,
+    timeframe: str = "1m",
+    facade: AnalyticsFacade = Depends(get_facade),
+) -> dict:
     """
     Compute technical indicators for `symbol`.
 
     This mirrors the Homework 3 `/coins/{coin_id}/technical` endpoint,
     but focuses only on technical analysis and delegates the actual
     computation to the Strategy/Facade layer.
-    """
-    symbol = symbol.upper()
 
-    timeframe_map = {"1d": 1, "1w": 7, "1m": 30}
-    if timeframe not in timeframe_map:
+    Cache hits are answered on the event loop; the SQLite read and the
+    indicator computation run in a worker thread, once per key for all
+    concurrent requests.
+    """
+    if timeframe not in _TIMEFRAMES:
         raise HTTPException(
             status_code=400, detail="Invalid timeframe. Use 1d, 1w, or 1m"
         )
 
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # We pull up to 200 records like in Homework 3, enough for all indicators.
-        cursor.execute(
-            f"""
-            SELECT date, open, high, low, close, volume
-            FROM {config.TABLE_NAME}
-            WHERE symbol = ?
-            ORDER BY date DESC
-            LIMIT 200
-        """,
-            (symbol,),
-        )
-        rows = cursor.fetchall()
-        conn.close()
+    # Symbols usually arrive uppercased by the gateway already.
+    if not symbol.isupper():
+        symbol = symbol.upper()
 
-        if not rows:
-            raise HTTPException(status_code=404, detail="Coin not found")
+    if _KNOWN_SYMBOLS is not None and symbol not in _KNOWN_SYMBOLS:
+        raise HTTPException(status_code=404, detail="Coin not found")
 
-        df = pd.DataFrame(
-            rows, columns=["date", "open", "high", "low", "close", "volume"]
-        )
+    key = (symbol, timeframe)
+    with _LOCK:
+        cached = _RESULT_CACHE.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
 
-        result = facade.get_technical(symbol=symbol, df=df, timeframe=timeframe)
-        if "error" in result:
-            # Return strategy errors directly (e.g. not enough data)
-            return result
+    job = _INFLIGHT.get(key)
+    if job is None:
+        job = asyncio.ensure_future(
+            asyncio.to_thread(_compute_technical, facade, symbol, timeframe)
+        )
+        _INFLIGHT[key] = job
+        job.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
 
+    try:
+        # Shielded so a disconnecting client does not cancel the others.
+        result = await asyncio.shield(job)
+    except sqlite3.Error:
+        # Other errors surface as FastAPI's plain 500.
+        raise HTTPException(status_code=503, detail="Database unavailable")
+
+    if "error" in result:
+        # Return strategy errors directly (e.g. not enough data)
         return result
-    except HTTPException:
-        raise
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
 
+    with _LOCK:
+        _RESULT_CACHE[key] = (time.monotonic() + _CACHE_TTL_SECONDS, result)
+    return result
 
+
+@app.post("/technical/{symbol}/invalidate")
+def invalidate_technical(symbol: str) -> dict:
+    """
+    Drop cached results for `symbol`, e.g. after a new candle was stored.
+    """
+    global _KNOWN_SYMBOLS
+    symbol = symbol.upper()
+    if _KNOWN_SYMBOLS is not None and symbol not in _KNOWN_SYMBOLS:
+        # A newly ingested coin: serve it now instead of after the next
+        # refresh. A single indexed lookup, so unknown symbols stay cheap.
+        if _symbol_exists(symbol):
+            _KNOWN_SYMBOLS = _KNOWN_SYMBOLS | {symbol}
+    with _LOCK:
+        keys = [key for key in _RESULT_CACHE if key[0] == symbol]
+        for key in keys:
+            del _RESULT_CACHE[key]
+    return {"symbol": symbol, "invalidated": len(keys)}